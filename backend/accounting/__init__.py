@@ -1 +1 @@
-# Accounting module for Hospital Management System
+# Accounting module for Hospital Management System
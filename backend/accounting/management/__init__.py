@@ -1 +1 @@
-# Management commands for accounting module
+# Management commands for accounting module
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.17 on 2026-08-29 13:36
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def percent_to_basis_points(apps, schema_editor):
+    """Convert stored percent rates (9.00) to basis points (900)."""
+    InvoiceLineItem = apps.get_model('accounting', 'InvoiceLineItem')
+    InvoiceLineItem.objects.update(
+        cgst_rate=F('cgst_rate') * 100,
+        sgst_rate=F('sgst_rate') * 100,
+        igst_rate=F('igst_rate') * 100,
+    )
+
+
+def basis_points_to_percent(apps, schema_editor):
+    InvoiceLineItem = apps.get_model('accounting', 'InvoiceLineItem')
+    InvoiceLineItem.objects.update(
+        cgst_rate=F('cgst_rate') / 100,
+        sgst_rate=F('sgst_rate') / 100,
+        igst_rate=F('igst_rate') / 100,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0002_alter_accountingauditlog_user'),
+    ]
+
+    operations = [
+        # Widen first: 28.00% becomes 2800.00, which would overflow the
+        # original numeric(5,2) column if multiplied in place.
+        migrations.AlterField(
+            model_name='invoicelineitem',
+            name='cgst_rate',
+            field=models.DecimalField(decimal_places=2, default=0.00, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='invoicelineitem',
+            name='igst_rate',
+            field=models.DecimalField(decimal_places=2, default=0.00, max_digits=7),
+        ),
+        migrations.AlterField(
+            model_name='invoicelineitem',
+            name='sgst_rate',
+            field=models.DecimalField(decimal_places=2, default=0.00, max_digits=7),
+        ),
+        migrations.RunPython(percent_to_basis_points, basis_points_to_percent),
+        migrations.AlterField(
+            model_name='invoicelineitem',
+            name='cgst_rate',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='invoicelineitem',
+            name='igst_rate',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='invoicelineitem',
+            name='sgst_rate',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+    ]
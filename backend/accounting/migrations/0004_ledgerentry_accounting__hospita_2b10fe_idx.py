@@ -0,0 +1,20 @@
+# Generated by Django 5.2.17 on 2026-08-29 13:40
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0003_alter_invoicelineitem_cgst_rate_and_more'),
+        ('hospitals', '0002_plan_hospitalplan'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ledgerentry',
+            index=models.Index(fields=['hospital', 'transaction_date'], name='accounting__hospita_2b10fe_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:04
+
+import django.db.models.functions.datetime
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0004_ledgerentry_accounting__hospita_2b10fe_idx'),
+        ('hospitals', '0002_plan_hospitalplan'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='depreciationschedule',
+            constraint=models.UniqueConstraint(models.F('asset'), django.db.models.functions.datetime.TruncMonth('depreciation_date'), name='unique_asset_depreciation_month'),
+        ),
+    ]
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:13
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0005_depreciationschedule_unique_asset_depreciation_month'),
+        ('hospitals', '0002_plan_hospitalplan'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReceivablesAgeingSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('as_of_date', models.DateField()),
+                ('bucket', models.CharField(choices=[('0-30', '0-30 days'), ('31-60', '31-60 days'), ('61-90', '61-90 days'), ('90+', 'Over 90 days')], max_length=10)),
+                ('total_cents', models.BigIntegerField(default=0)),
+                ('invoice_count', models.IntegerField(default=0)),
+                ('hospital', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(app_label)s_%(class)ss', to='hospitals.hospital')),
+            ],
+            options={
+                'ordering': ['as_of_date', 'bucket'],
+                'unique_together': {('hospital', 'as_of_date', 'bucket')},
+            },
+        ),
+    ]
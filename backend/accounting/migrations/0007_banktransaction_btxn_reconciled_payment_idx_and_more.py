@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:21
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0006_receivablesageingsummary'),
+        ('hospitals', '0002_plan_hospitalplan'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='banktransaction',
+            index=models.Index(condition=models.Q(('reconciled_payment__isnull', False)), fields=['reconciled_payment'], name='btxn_reconciled_payment_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='banktransaction',
+            index=models.Index(condition=models.Q(('reconciled_expense__isnull', False)), fields=['reconciled_expense'], name='btxn_reconciled_expense_idx'),
+        ),
+    ]
@@ -0,0 +1,26 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:23
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0007_banktransaction_btxn_reconciled_payment_idx_and_more'),
+        ('billing', '0006_remove_bill_bill_status_idx_and_more'),
+        ('hospitals', '0002_plan_hospitalplan'),
+        ('patients', '0004_alter_patient_medical_record_number'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='accountinginvoice',
+            index=models.Index(condition=models.Q(('balance_cents__gt', 0), ('status__in', ['SENT', 'OVERDUE', 'PARTIAL'])), fields=['hospital', 'due_date'], name='invoice_outstanding_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='banktransaction',
+            index=models.Index(condition=models.Q(('is_reconciled', False)), fields=['bank_account', 'transaction_date', 'amount_cents'], name='btxn_unreconciled_idx'),
+        ),
+    ]
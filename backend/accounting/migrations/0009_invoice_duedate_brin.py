@@ -0,0 +1,32 @@
+from django.db import migrations
+
+
+def add_brin_index(apps, schema_editor):
+    # BRIN is PostgreSQL-only; the sqlite test database skips it. The
+    # ageing queries filter due_date with range predicates, and invoice
+    # rows arrive in roughly due-date order, so block-range summaries
+    # prune most of the table at a fraction of a B-tree's size.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS invoice_duedate_brin "
+        "ON accounting_accountinginvoice USING BRIN (due_date) "
+        "WITH (pages_per_range = 32)"
+    )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS invoice_duedate_brin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0008_accountinginvoice_invoice_outstanding_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_brin_index, drop_brin_index),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0009_invoice_duedate_brin'),
+        ('hospitals', '0002_plan_hospitalplan'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='accountingpayment',
+            name='is_matched',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='expense',
+            name='is_matched',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddIndex(
+            model_name='accountingpayment',
+            index=models.Index(condition=models.Q(('is_matched', False)), fields=['bank_account', 'payment_date'], name='payment_unmatched_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expense',
+            index=models.Index(condition=models.Q(('is_matched', False)), fields=['payment_date'], name='expense_unmatched_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+from django.db import migrations
+
+
+def backfill_is_matched(apps, schema_editor):
+    """Flag payments/expenses already referenced by a bank transaction"""
+    AccountingPayment = apps.get_model('accounting', 'AccountingPayment')
+    Expense = apps.get_model('accounting', 'Expense')
+    AccountingPayment.objects.filter(
+        banktransaction__isnull=False
+    ).update(is_matched=True)
+    Expense.objects.filter(
+        banktransaction__isnull=False
+    ).update(is_matched=True)
+
+
+def clear_is_matched(apps, schema_editor):
+    AccountingPayment = apps.get_model('accounting', 'AccountingPayment')
+    Expense = apps.get_model('accounting', 'Expense')
+    AccountingPayment.objects.update(is_matched=False)
+    Expense.objects.update(is_matched=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0010_accountingpayment_is_matched_expense_is_matched_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_is_matched, clear_is_matched),
+    ]
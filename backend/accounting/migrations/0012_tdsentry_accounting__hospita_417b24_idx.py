@@ -0,0 +1,20 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:39
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounting', '0011_backfill_is_matched'),
+        ('hospitals', '0002_plan_hospitalplan'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='tdsentry',
+            index=models.Index(fields=['hospital', 'deduction_date'], name='accounting__hospita_417b24_idx'),
+        ),
+    ]
@@ -1 +1 @@
-# Accounting migrations
+# Accounting migrations
@@ -0,0 +1,41 @@
+from celery import shared_task
+from datetime import date
+
+from hospitals.models import Hospital
+from .utils import AgeingReportGenerator, DepreciationCalculator
+
+
+@shared_task
+def process_monthly_depreciation_for_hospital(hospital_id, processing_date=None):
+    """Run monthly depreciation for one hospital on a worker"""
+    hospital = Hospital.objects.get(pk=hospital_id)
+    if processing_date:
+        processing_date = date.fromisoformat(processing_date)
+    return DepreciationCalculator.process_monthly_depreciation(hospital, processing_date)
+
+
+@shared_task
+def process_monthly_depreciation_all_hospitals(processing_date=None):
+    """Fan monthly depreciation out across workers, one task per hospital.
+
+    Each hospital's run is already reduced to a handful of bulk statements,
+    so hospitals are the natural unit of parallelism.
+    """
+    for hospital_id in Hospital.objects.values_list('id', flat=True):
+        process_monthly_depreciation_for_hospital.delay(hospital_id, processing_date)
+
+
+@shared_task
+def refresh_receivables_ageing(hospital_id, as_of_date=None):
+    """Recompute the materialized ageing buckets for one hospital"""
+    hospital = Hospital.objects.get(pk=hospital_id)
+    if as_of_date:
+        as_of_date = date.fromisoformat(as_of_date)
+    AgeingReportGenerator.materialize_receivables_ageing(hospital, as_of_date)
+
+
+@shared_task
+def rebuild_receivables_ageing_all_hospitals(as_of_date=None):
+    """Nightly full rebuild of the ageing rollup, one task per hospital"""
+    for hospital_id in Hospital.objects.values_list('id', flat=True):
+        refresh_receivables_ageing.delay(hospital_id, as_of_date)
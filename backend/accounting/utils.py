@@ -1,875 +1,1209 @@
-"""
-Business logic utilities for accounting operations.
-"""
-
-from django.db import transaction
-from django.utils import timezone
-from decimal import Decimal
-from datetime import datetime, date, timedelta
-import openpyxl
-from django.db import models
-from openpyxl.styles import Font, PatternFill, Border, Side
-import xml.etree.ElementTree as ET
-import json
-import csv
-import io
-
-from .models import (
-    LedgerEntry, ChartOfAccounts, Currency, FinancialYear,
-    AccountingInvoice, AccountingPayment, Expense, PayrollEntry,
-    FixedAsset, DepreciationSchedule, TaxLiability, BankTransaction
-)
-
-
-class DoubleEntryBookkeeping:
-    """Handle double-entry bookkeeping operations"""
-    
-    @staticmethod
-    @transaction.atomic
-    def create_journal_entry(hospital, debit_account_code, credit_account_code, 
-                           amount_cents, description, reference_number,
-                           transaction_date=None, created_by=None, 
-                           source_invoice=None, source_payment=None, 
-                           source_expense=None, source_payroll=None):
-        """
-        Create a double-entry journal entry
-        """
-        if not transaction_date:
-            transaction_date = timezone.now().date()
-            
-        # Get accounts
-        try:
-            debit_account = ChartOfAccounts.objects.get(
-                hospital=hospital, account_code=debit_account_code, is_active=True
-            )
-            credit_account = ChartOfAccounts.objects.get(
-                hospital=hospital, account_code=credit_account_code, is_active=True
-            )
-        except ChartOfAccounts.DoesNotExist as e:
-            raise ValueError(f"Account not found: {e}")
-            
-        # Get base currency
-        currency = Currency.objects.filter(hospital=hospital, is_base_currency=True).first()
-        if not currency:
-            raise ValueError("No base currency configured")
-            
-        # Create ledger entry
-        ledger_entry = LedgerEntry.objects.create(
-            hospital=hospital,
-            transaction_date=transaction_date,
-            reference_number=reference_number,
-            description=description,
-            debit_account=debit_account,
-            credit_account=credit_account,
-            amount_cents=amount_cents,
-            currency=currency,
-            created_by=created_by,
-            invoice=source_invoice,
-            payment=source_payment,
-            expense=source_expense,
-            payroll=source_payroll
-        )
-        
-        return ledger_entry
-
-    @staticmethod
-    def post_invoice_entries(invoice):
-        """Post accounting entries for an invoice"""
-        entries = []
-        
-        # Accounts Receivable Dr / Sales Cr
-        entries.append(DoubleEntryBookkeeping.create_journal_entry(
-            hospital=invoice.hospital,
-            debit_account_code='1200',  # Accounts Receivable
-            credit_account_code='4000',  # Sales Revenue
-            amount_cents=invoice.total_cents,
-            description=f"Sales invoice {invoice.invoice_number}",
-            reference_number=invoice.invoice_number,
-            transaction_date=invoice.invoice_date,
-            created_by=invoice.created_by,
-            source_invoice=invoice
-        ))
-        
-        # Cost of Sales entries if applicable
-        for item in invoice.items.filter(cost_price_cents__gt=0):
-            # Cost of Sales Dr / Inventory Cr
-            entries.append(DoubleEntryBookkeeping.create_journal_entry(
-                hospital=invoice.hospital,
-                debit_account_code='5000',  # Cost of Sales
-                credit_account_code='1300',  # Inventory
-                amount_cents=item.cost_price_cents * int(item.quantity),
-                description=f"Cost of sales for {item.description}",
-                reference_number=invoice.invoice_number,
-                transaction_date=invoice.invoice_date,
-                created_by=invoice.created_by,
-                source_invoice=invoice
-            ))
-        
-        return entries
-
-    @staticmethod
-    def post_payment_entries(payment):
-        """Post accounting entries for a payment"""
-        # Cash/Bank Dr / Accounts Receivable Cr
-        bank_account_code = '1100' if payment.payment_method == 'CASH' else '1150'
-        
-        entry = DoubleEntryBookkeeping.create_journal_entry(
-            hospital=payment.hospital,
-            debit_account_code=bank_account_code,
-            credit_account_code='1200',  # Accounts Receivable
-            amount_cents=payment.amount_cents,
-            description=f"Payment received - {payment.payment_number}",
-            reference_number=payment.payment_number,
-            transaction_date=payment.payment_date,
-            created_by=payment.received_by,
-            source_payment=payment
-        )
-        
-        # TDS entry if applicable
-        if payment.tds_cents > 0:
-            DoubleEntryBookkeeping.create_journal_entry(
-                hospital=payment.hospital,
-                debit_account_code='1400',  # TDS Receivable
-                credit_account_code='2300',  # TDS Payable
-                amount_cents=payment.tds_cents,
-                description=f"TDS on payment {payment.payment_number}",
-                reference_number=payment.payment_number,
-                transaction_date=payment.payment_date,
-                created_by=payment.received_by,
-                source_payment=payment
-            )
-        
-        return entry
-
-    @staticmethod
-    def post_expense_entries(expense):
-        """Post accounting entries for expenses"""
-        # Expense Dr / Accounts Payable Cr
-        expense_account_code = {
-            'MEDICAL_SUPPLIES': '5100',
-            'PHARMACEUTICALS': '5110', 
-            'EQUIPMENT': '5120',
-            'UTILITIES': '6100',
-            'RENT': '6200',
-            'SALARIES': '6300',
-            'PROFESSIONAL_FEES': '6400',
-            'MAINTENANCE': '6500',
-            'INSURANCE': '6600',
-            'MARKETING': '6700',
-            'ADMINISTRATIVE': '6800',
-            'OTHER': '6900'
-        }.get(expense.category, '6900')
-        
-        entry = DoubleEntryBookkeeping.create_journal_entry(
-            hospital=expense.hospital,
-            debit_account_code=expense_account_code,
-            credit_account_code='2100',  # Accounts Payable
-            amount_cents=expense.amount_cents,
-            description=f"Expense - {expense.description}",
-            reference_number=expense.expense_number,
-            transaction_date=expense.expense_date,
-            created_by=expense.created_by,
-            source_expense=expense
-        )
-        
-        return entry
-
-    @staticmethod
-    def post_payroll_entries(payroll):
-        """Post accounting entries for payroll"""
-        entries = []
-        
-        # Salary Expense Dr / Salary Payable Cr
-        entries.append(DoubleEntryBookkeeping.create_journal_entry(
-            hospital=payroll.hospital,
-            debit_account_code='6300',  # Salary Expense
-            credit_account_code='2400',  # Salary Payable
-            amount_cents=payroll.net_salary_cents,
-            description=f"Salary for {payroll.employee.get_full_name()}",
-            reference_number=f"PAY-{payroll.id}",
-            transaction_date=payroll.pay_date,
-            created_by=payroll.created_by,
-            source_payroll=payroll
-        ))
-        
-        # Employer contributions
-        if payroll.pf_employer_cents > 0:
-            entries.append(DoubleEntryBookkeeping.create_journal_entry(
-                hospital=payroll.hospital,
-                debit_account_code='6310',  # PF Expense
-                credit_account_code='2410',  # PF Payable
-                amount_cents=payroll.pf_employer_cents,
-                description=f"Employer PF contribution for {payroll.employee.get_full_name()}",
-                reference_number=f"PAY-{payroll.id}",
-                transaction_date=payroll.pay_date,
-                created_by=payroll.created_by,
-                source_payroll=payroll
-            ))
-            
-        if payroll.esi_employer_cents > 0:
-            entries.append(DoubleEntryBookkeeping.create_journal_entry(
-                hospital=payroll.hospital,
-                debit_account_code='6320',  # ESI Expense
-                credit_account_code='2420',  # ESI Payable
-                amount_cents=payroll.esi_employer_cents,
-                description=f"Employer ESI contribution for {payroll.employee.get_full_name()}",
-                reference_number=f"PAY-{payroll.id}",
-                transaction_date=payroll.pay_date,
-                created_by=payroll.created_by,
-                source_payroll=payroll
-            ))
-        
-        return entries
-
-
-class DepreciationCalculator:
-    """Handle asset depreciation calculations"""
-    
-    @staticmethod
-    def calculate_monthly_depreciation(asset):
-        """Calculate monthly depreciation for an asset"""
-        annual_depreciation = asset.calculate_annual_depreciation()
-        return annual_depreciation // 12
-    
-    @staticmethod
-    def generate_depreciation_schedule(asset):
-        """Generate complete depreciation schedule for an asset"""
-        schedule = []
-        current_book_value = asset.purchase_cost_cents
-        accumulated_depreciation = 0
-        
-        for year in range(asset.useful_life_years):
-            if asset.depreciation_method == 'STRAIGHT_LINE':
-                annual_depreciation = (asset.purchase_cost_cents - asset.salvage_value_cents) // asset.useful_life_years
-            elif asset.depreciation_method == 'REDUCING_BALANCE':
-                rate = asset.depreciation_rate / 100 if asset.depreciation_rate else (1 / asset.useful_life_years)
-                annual_depreciation = int(current_book_value * rate)
-            else:  # DOUBLE_DECLINING
-                rate = 2 / asset.useful_life_years
-                annual_depreciation = int(current_book_value * rate)
-            
-            # Ensure we don't depreciate below salvage value
-            if accumulated_depreciation + annual_depreciation > (asset.purchase_cost_cents - asset.salvage_value_cents):
-                annual_depreciation = (asset.purchase_cost_cents - asset.salvage_value_cents) - accumulated_depreciation
-            
-            accumulated_depreciation += annual_depreciation
-            current_book_value = asset.purchase_cost_cents - accumulated_depreciation
-            
-            schedule.append({
-                'year': year + 1,
-                'depreciation_amount': annual_depreciation,
-                'accumulated_depreciation': accumulated_depreciation,
-                'book_value': current_book_value,
-                'date': date(asset.purchase_date.year + year + 1, asset.purchase_date.month, asset.purchase_date.day)
-            })
-            
-            if current_book_value <= asset.salvage_value_cents:
-                break
-        
-        return schedule
-
-    @staticmethod
-    @transaction.atomic
-    def process_monthly_depreciation(hospital, processing_date=None):
-        """Process depreciation for all assets for a given month"""
-        if not processing_date:
-            processing_date = timezone.now().date()
-        
-        active_assets = FixedAsset.objects.filter(
-            hospital=hospital,
-            is_active=True,
-            purchase_date__lt=processing_date
-        )
-        
-        processed_count = 0
-        for asset in active_assets:
-            # Check if depreciation already processed for this month
-            existing_entry = DepreciationSchedule.objects.filter(
-                asset=asset,
-                depreciation_date__year=processing_date.year,
-                depreciation_date__month=processing_date.month
-            ).first()
-            
-            if existing_entry:
-                continue
-            
-            monthly_depreciation = DepreciationCalculator.calculate_monthly_depreciation(asset)
-            if monthly_depreciation <= 0:
-                continue
-            
-            # Create depreciation schedule entry
-            new_accumulated = asset.accumulated_depreciation_cents + monthly_depreciation
-            new_book_value = asset.purchase_cost_cents - new_accumulated
-            
-            depreciation_entry = DepreciationSchedule.objects.create(
-                hospital=hospital,
-                asset=asset,
-                depreciation_date=processing_date,
-                depreciation_amount_cents=monthly_depreciation,
-                accumulated_depreciation_cents=new_accumulated,
-                book_value_cents=new_book_value,
-                is_processed=True
-            )
-            
-            # Update asset
-            asset.accumulated_depreciation_cents = new_accumulated
-            asset.current_book_value_cents = new_book_value
-            asset.save(update_fields=['accumulated_depreciation_cents', 'current_book_value_cents'])
-            
-            # Create accounting entry
-            DoubleEntryBookkeeping.create_journal_entry(
-                hospital=hospital,
-                debit_account_code='6900',  # Depreciation Expense
-                credit_account_code='1500',  # Accumulated Depreciation
-                amount_cents=monthly_depreciation,
-                description=f"Monthly depreciation for {asset.name}",
-                reference_number=f"DEP-{asset.asset_code}-{processing_date.strftime('%Y%m')}",
-                transaction_date=processing_date
-            )
-            
-            processed_count += 1
-        
-        return processed_count
-
-
-class TaxCalculator:
-    """Handle tax calculations"""
-    
-    @staticmethod
-    def calculate_gst(amount_cents, gst_rate, is_interstate=False):
-        """Calculate GST breakdown"""
-        gst_amount = int(amount_cents * gst_rate / 100)
-        
-        if is_interstate:
-            return {
-                'igst_cents': gst_amount,
-                'cgst_cents': 0,
-                'sgst_cents': 0,
-                'total_tax_cents': gst_amount
-            }
-        else:
-            # Split equally between CGST and SGST
-            cgst = gst_amount // 2
-            sgst = gst_amount - cgst  # Handle odd amounts
-            return {
-                'igst_cents': 0,
-                'cgst_cents': cgst,
-                'sgst_cents': sgst,
-                'total_tax_cents': cgst + sgst
-            }
-
-    @staticmethod
-    def calculate_tds(gross_amount_cents, tds_rate):
-        """Calculate TDS amount"""
-        return int(gross_amount_cents * tds_rate / 100)
-
-    @staticmethod
-    def get_tax_liability_for_period(hospital, start_date, end_date, tax_type='GST'):
-        """Calculate tax liability for a specific period"""
-        # Get all invoices in the period
-        invoices = AccountingInvoice.objects.filter(
-            hospital=hospital,
-            invoice_date__gte=start_date,
-            invoice_date__lte=end_date,
-            status__in=['PAID', 'PARTIAL']
-        )
-        
-        total_sales = sum(inv.total_cents for inv in invoices)
-        total_tax_collected = sum(inv.tax_cents for inv in invoices)
-        
-        # Get input tax credit from expenses
-        expenses = Expense.objects.filter(
-            hospital=hospital,
-            expense_date__gte=start_date,
-            expense_date__lte=end_date
-        )
-        
-        input_tax_credit = sum(exp.tax_cents for exp in expenses)
-        
-        net_tax_liability = total_tax_collected - input_tax_credit
-        
-        return {
-            'total_sales_cents': total_sales,
-            'taxable_sales_cents': total_sales,  # Simplified - all sales are taxable
-            'tax_collected_cents': total_tax_collected,
-            'input_tax_credit_cents': input_tax_credit,
-            'net_tax_liability_cents': net_tax_liability
-        }
-
-
-class ReportGenerator:
-    """Generate financial reports"""
-    
-    @staticmethod
-    def generate_trial_balance(hospital, as_of_date):
-        """Generate trial balance report"""
-        accounts = ChartOfAccounts.objects.filter(hospital=hospital, is_active=True)
-        trial_balance = []
-        
-        total_debits = 0
-        total_credits = 0
-        
-        for account in accounts:
-            debit_sum = account.debit_entries.filter(
-                transaction_date__lte=as_of_date
-            ).aggregate(total=models.Sum('amount_cents'))['total'] or 0
-            
-            credit_sum = account.credit_entries.filter(
-                transaction_date__lte=as_of_date
-            ).aggregate(total=models.Sum('amount_cents'))['total'] or 0
-            
-            balance = debit_sum - credit_sum
-            
-            if balance != 0:  # Only include accounts with balances
-                if balance > 0:
-                    debit_balance = balance
-                    credit_balance = 0
-                    total_debits += debit_balance
-                else:
-                    debit_balance = 0
-                    credit_balance = abs(balance)
-                    total_credits += credit_balance
-                
-                trial_balance.append({
-                    'account_code': account.account_code,
-                    'account_name': account.account_name,
-                    'account_type': account.account_type,
-                    'debit_balance_cents': debit_balance,
-                    'credit_balance_cents': credit_balance
-                })
-        
-        return {
-            'accounts': trial_balance,
-            'total_debits': total_debits,
-            'total_credits': total_credits,
-            'is_balanced': total_debits == total_credits
-        }
-
-    @staticmethod
-    def generate_profit_loss(hospital, start_date, end_date):
-        """Generate Profit & Loss statement"""
-        # Income accounts
-        income_accounts = ChartOfAccounts.objects.filter(
-            hospital=hospital,
-            account_type='INCOME',
-            is_active=True
-        )
-        
-        total_income = 0
-        income_details = []
-        
-        for account in income_accounts:
-            credit_sum = account.credit_entries.filter(
-                transaction_date__gte=start_date,
-                transaction_date__lte=end_date
-            ).aggregate(total=models.Sum('amount_cents'))['total'] or 0
-            
-            debit_sum = account.debit_entries.filter(
-                transaction_date__gte=start_date,
-                transaction_date__lte=end_date
-            ).aggregate(total=models.Sum('amount_cents'))['total'] or 0
-            
-            net_income = credit_sum - debit_sum
-            total_income += net_income
-            
-            if net_income != 0:
-                income_details.append({
-                    'account_code': account.account_code,
-                    'account_name': account.account_name,
-                    'amount_cents': net_income
-                })
-        
-        # Expense accounts
-        expense_accounts = ChartOfAccounts.objects.filter(
-            hospital=hospital,
-            account_type='EXPENSES',
-            is_active=True
-        )
-        
-        total_expenses = 0
-        expense_details = []
-        
-        for account in expense_accounts:
-            debit_sum = account.debit_entries.filter(
-                transaction_date__gte=start_date,
-                transaction_date__lte=end_date
-            ).aggregate(total=models.Sum('amount_cents'))['total'] or 0
-            
-            credit_sum = account.credit_entries.filter(
-                transaction_date__gte=start_date,
-                transaction_date__lte=end_date
-            ).aggregate(total=models.Sum('amount_cents'))['total'] or 0
-            
-            net_expense = debit_sum - credit_sum
-            total_expenses += net_expense
-            
-            if net_expense != 0:
-                expense_details.append({
-                    'account_code': account.account_code,
-                    'account_name': account.account_name,
-                    'amount_cents': net_expense
-                })
-        
-        net_profit = total_income - total_expenses
-        
-        return {
-            'period': f"{start_date} to {end_date}",
-            'income': income_details,
-            'expenses': expense_details,
-            'total_income_cents': total_income,
-            'total_expenses_cents': total_expenses,
-            'net_profit_cents': net_profit
-        }
-
-    @staticmethod
-    def generate_balance_sheet(hospital, as_of_date):
-        """Generate Balance Sheet"""
-        balance_sheet = {
-            'as_of_date': as_of_date,
-            'assets': {'current_assets': [], 'fixed_assets': [], 'total_assets_cents': 0},
-            'liabilities': {'current_liabilities': [], 'long_term_liabilities': [], 'total_liabilities_cents': 0},
-            'equity': {'equity_accounts': [], 'total_equity_cents': 0}
-        }
-        
-        # Assets
-        asset_accounts = ChartOfAccounts.objects.filter(
-            hospital=hospital,
-            account_type='ASSETS',
-            is_active=True
-        )
-        
-        for account in asset_accounts:
-            balance = account.balance
-            if balance > 0:
-                asset_data = {
-                    'account_code': account.account_code,
-                    'account_name': account.account_name,
-                    'amount_cents': balance
-                }
-                
-                if account.account_subtype == 'CURRENT_ASSETS':
-                    balance_sheet['assets']['current_assets'].append(asset_data)
-                else:
-                    balance_sheet['assets']['fixed_assets'].append(asset_data)
-                
-                balance_sheet['assets']['total_assets_cents'] += balance
-        
-        # Liabilities
-        liability_accounts = ChartOfAccounts.objects.filter(
-            hospital=hospital,
-            account_type='LIABILITIES',
-            is_active=True
-        )
-        
-        for account in liability_accounts:
-            balance = account.balance
-            if balance > 0:
-                liability_data = {
-                    'account_code': account.account_code,
-                    'account_name': account.account_name,
-                    'amount_cents': balance
-                }
-                
-                if account.account_subtype == 'CURRENT_LIABILITIES':
-                    balance_sheet['liabilities']['current_liabilities'].append(liability_data)
-                else:
-                    balance_sheet['liabilities']['long_term_liabilities'].append(liability_data)
-                
-                balance_sheet['liabilities']['total_liabilities_cents'] += balance
-        
-        # Equity
-        equity_accounts = ChartOfAccounts.objects.filter(
-            hospital=hospital,
-            account_type='EQUITY',
-            is_active=True
-        )
-        
-        for account in equity_accounts:
-            balance = account.balance
-            if balance != 0:
-                balance_sheet['equity']['equity_accounts'].append({
-                    'account_code': account.account_code,
-                    'account_name': account.account_name,
-                    'amount_cents': balance
-                })
-                balance_sheet['equity']['total_equity_cents'] += balance
-        
-        return balance_sheet
-
-
-class ExportEngine:
-    """Handle various export formats"""
-    
-    @staticmethod
-    def export_to_excel(data, headers, filename):
-        """Export data to Excel format"""
-        workbook = openpyxl.Workbook()
-        worksheet = workbook.active
-        
-        # Header styling
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-        border = Border(
-            left=Side(border_style="thin"),
-            right=Side(border_style="thin"),
-            top=Side(border_style="thin"),
-            bottom=Side(border_style="thin")
-        )
-        
-        # Write headers
-        for col, header in enumerate(headers, 1):
-            cell = worksheet.cell(row=1, column=col, value=header)
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.border = border
-        
-        # Write data
-        for row_idx, row_data in enumerate(data, 2):
-            for col_idx, value in enumerate(row_data, 1):
-                cell = worksheet.cell(row=row_idx, column=col_idx, value=value)
-                cell.border = border
-        
-        # Auto-adjust column widths
-        for column in worksheet.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            worksheet.column_dimensions[column_letter].width = adjusted_width
-        
-        # Save to BytesIO
-        excel_buffer = io.BytesIO()
-        workbook.save(excel_buffer)
-        excel_buffer.seek(0)
-        
-        return excel_buffer
-
-    @staticmethod
-    def export_to_tally_xml(transactions, export_type='SALES'):
-        """Export to Tally-compatible XML format"""
-        root = ET.Element("ENVELOPE")
-        header = ET.SubElement(root, "HEADER")
-        ET.SubElement(header, "TALLYREQUEST").text = "Import Data"
-        
-        body = ET.SubElement(root, "BODY")
-        import_data = ET.SubElement(body, "IMPORTDATA")
-        request_desc = ET.SubElement(import_data, "REQUESTDESC")
-        ET.SubElement(request_desc, "REPORTNAME").text = "Vouchers"
-        
-        request_data = ET.SubElement(import_data, "REQUESTDATA")
-        
-        for transaction in transactions:
-            voucher = ET.SubElement(request_data, "TALLYMESSAGE")
-            voucher_data = ET.SubElement(voucher, "VOUCHER")
-            
-            if export_type == 'SALES':
-                ET.SubElement(voucher_data, "VOUCHERTYPENAME").text = "Sales"
-                ET.SubElement(voucher_data, "PARTYLEDGERNAME").text = transaction.get('party_name', '')
-                ET.SubElement(voucher_data, "DATE").text = transaction.get('date', '').strftime('%Y%m%d')
-                ET.SubElement(voucher_data, "AMOUNT").text = str(transaction.get('amount_cents', 0) / 100)
-            elif export_type == 'PURCHASE':
-                ET.SubElement(voucher_data, "VOUCHERTYPENAME").text = "Purchase"
-            # Add other voucher types as needed
-        
-        return ET.tostring(root, encoding='unicode')
-
-    @staticmethod
-    def export_gst_returns(hospital, start_date, end_date, return_type='GSTR1'):
-        """Export GST returns in JSON format"""
-        if return_type == 'GSTR1':
-            # B2B supplies
-            b2b_supplies = []
-            invoices = AccountingInvoice.objects.filter(
-                hospital=hospital,
-                invoice_date__gte=start_date,
-                invoice_date__lte=end_date,
-                invoice_type='CORPORATE'
-            )
-            
-            for invoice in invoices:
-                if invoice.customer and invoice.customer.gstin:
-                    b2b_supplies.append({
-                        "ctin": invoice.customer.gstin,
-                        "inv": [{
-                            "inum": invoice.invoice_number,
-                            "idt": invoice.invoice_date.strftime('%d-%m-%Y'),
-                            "val": invoice.total_cents / 100,
-                            "pos": "07",  # Place of supply - needs to be configured
-                            "rchrg": "N",
-                            "inv_typ": "R",
-                            "itms": []
-                        }]
-                    })
-            
-            return {
-                "gstin": "",  # Hospital's GSTIN - needs to be configured
-                "ret_period": start_date.strftime('%m%Y'),
-                "b2b": b2b_supplies
-            }
-        
-        # Add other GST return types as needed
-        return {}
-
-
-class AgeingReportGenerator:
-    """Generate ageing reports for receivables and payables"""
-    
-    @staticmethod
-    def generate_receivables_ageing(hospital, as_of_date):
-        """Generate ageing report for accounts receivable"""
-        unpaid_invoices = AccountingInvoice.objects.filter(
-            hospital=hospital,
-            status__in=['SENT', 'OVERDUE', 'PARTIAL'],
-            balance_cents__gt=0
-        )
-        
-        ageing_buckets = {
-            '0-30': [], '31-60': [], '61-90': [], '90+': []
-        }
-        
-        for invoice in unpaid_invoices:
-            days_outstanding = (as_of_date - invoice.due_date).days
-            
-            ageing_data = {
-                'invoice_number': invoice.invoice_number,
-                'customer': str(invoice.customer or invoice.patient),
-                'invoice_date': invoice.invoice_date,
-                'due_date': invoice.due_date,
-                'total_cents': invoice.total_cents,
-                'balance_cents': invoice.balance_cents,
-                'days_outstanding': days_outstanding
-            }
-            
-            if days_outstanding <= 30:
-                ageing_buckets['0-30'].append(ageing_data)
-            elif days_outstanding <= 60:
-                ageing_buckets['31-60'].append(ageing_data)
-            elif days_outstanding <= 90:
-                ageing_buckets['61-90'].append(ageing_data)
-            else:
-                ageing_buckets['90+'].append(ageing_data)
-        
-        # Calculate totals for each bucket
-        bucket_totals = {}
-        for bucket, invoices in ageing_buckets.items():
-            bucket_totals[bucket] = sum(inv['balance_cents'] for inv in invoices)
-        
-        return {
-            'as_of_date': as_of_date,
-            'ageing_buckets': ageing_buckets,
-            'bucket_totals': bucket_totals,
-            'grand_total': sum(bucket_totals.values())
-        }
-
-
-class BankReconciliationHelper:
-    """Help with bank reconciliation"""
-    
-    @staticmethod
-    def auto_match_transactions(bank_account, tolerance_cents=100):
-        """Auto-match bank transactions with payments/expenses"""
-        unreconciled_bank_txns = BankTransaction.objects.filter(
-            bank_account=bank_account,
-            is_reconciled=False
-        )
-        
-        matched_count = 0
-        
-        for bank_txn in unreconciled_bank_txns:
-            if bank_txn.transaction_type == 'CREDIT':
-                # Try to match with payments
-                matching_payments = AccountingPayment.objects.filter(
-                    bank_account=bank_account,
-                    payment_date=bank_txn.transaction_date,
-                    amount_cents__gte=bank_txn.amount_cents - tolerance_cents,
-                    amount_cents__lte=bank_txn.amount_cents + tolerance_cents,
-                    status='CLEARED'
-                ).exclude(banktransaction__isnull=False)
-                
-                if matching_payments.count() == 1:
-                    payment = matching_payments.first()
-                    bank_txn.reconciled_payment = payment
-                    bank_txn.is_reconciled = True
-                    bank_txn.reconciled_at = timezone.now()
-                    bank_txn.save()
-                    matched_count += 1
-            
-            else:  # DEBIT
-                # Try to match with expenses
-                matching_expenses = Expense.objects.filter(
-                    payment_date=bank_txn.transaction_date,
-                    net_amount_cents__gte=bank_txn.amount_cents - tolerance_cents,
-                    net_amount_cents__lte=bank_txn.amount_cents + tolerance_cents,
-                    is_paid=True
-                ).exclude(banktransaction__isnull=False)
-                
-                if matching_expenses.count() == 1:
-                    expense = matching_expenses.first()
-                    bank_txn.reconciled_expense = expense
-                    bank_txn.is_reconciled = True
-                    bank_txn.reconciled_at = timezone.now()
-                    bank_txn.save()
-                    matched_count += 1
-        
-        return matched_count
-
-
-class ComplianceReporter:
-    """Generate compliance reports"""
-    
-    @staticmethod
-    def generate_tds_return(hospital, quarter, financial_year):
-        """Generate TDS return data"""
-        from .models import TDSEntry
-        
-        # Calculate quarter dates
-        quarter_months = {
-            'Q1': (4, 6),   # Apr-Jun
-            'Q2': (7, 9),   # Jul-Sep
-            'Q3': (10, 12), # Oct-Dec
-            'Q4': (1, 3)    # Jan-Mar
-        }
-        
-        start_month, end_month = quarter_months[quarter]
-        if quarter == 'Q4':
-            start_date = date(financial_year + 1, start_month, 1)
-            end_date = date(financial_year + 1, end_month + 1, 1) - timedelta(days=1)
-        else:
-            start_date = date(financial_year, start_month, 1)
-            end_date = date(financial_year, end_month + 1, 1) - timedelta(days=1)
-        
-        tds_entries = TDSEntry.objects.filter(
-            hospital=hospital,
-            deduction_date__gte=start_date,
-            deduction_date__lte=end_date
-        )
-        
-        # Group by section and vendor/employee
-        tds_summary = {}
-        for entry in tds_entries:
-            key = (entry.section, entry.vendor_id or entry.employee_id)
-            if key not in tds_summary:
-                tds_summary[key] = {
-                    'section': entry.section,
-                    'deductee': str(entry.vendor or entry.employee),
-                    'pan': getattr(entry.vendor, 'pan', '') or getattr(entry.employee, 'profile', {}).get('pan', ''),
-                    'gross_amount_cents': 0,
-                    'tds_amount_cents': 0
-                }
-            
-            tds_summary[key]['gross_amount_cents'] += entry.gross_amount_cents
-            tds_summary[key]['tds_amount_cents'] += entry.tds_amount_cents
-        
-        return {
-            'quarter': quarter,
-            'financial_year': financial_year,
-            'start_date': start_date,
-            'end_date': end_date,
-            'tds_entries': list(tds_summary.values()),
-            'total_tds_cents': sum(entry['tds_amount_cents'] for entry in tds_summary.values())
-        }
+"""
+Business logic utilities for accounting operations.
+"""
+
+from django.db import transaction
+from django.utils import timezone
+from decimal import Decimal
+from datetime import datetime, date, timedelta
+from functools import lru_cache
+import openpyxl
+from django.db import models
+from django.db.models.functions import Coalesce
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Border, Side
+from openpyxl.utils import get_column_letter
+from xml.sax.saxutils import escape
+import json
+import csv
+import io
+
+from core.routers import reporting_db
+from hospitals.models import Hospital
+
+from .models import (
+    LedgerEntry, ChartOfAccounts, Currency, FinancialYear,
+    AccountingInvoice, AccountingPayment, Expense, PayrollEntry,
+    FixedAsset, DepreciationSchedule, TaxLiability, BankTransaction,
+    ReceivablesAgeingSummary
+)
+
+
+@lru_cache(maxsize=4096)
+def get_account_id(hospital_id, account_code):
+    """Resolve an active account code to its pk, cached per hospital.
+
+    Cleared by the ChartOfAccounts signals whenever accounts change.
+    """
+    try:
+        return ChartOfAccounts.objects.values_list('id', flat=True).get(
+            hospital_id=hospital_id, account_code=account_code, is_active=True
+        )
+    except ChartOfAccounts.DoesNotExist as e:
+        raise ValueError(f"Account not found: {e}")
+
+
+@lru_cache(maxsize=1024)
+def get_base_currency_id(hospital_id):
+    """Resolve a hospital's base currency pk, cached until currencies change"""
+    currency_id = Currency.objects.filter(
+        hospital_id=hospital_id, is_base_currency=True
+    ).values_list('id', flat=True).first()
+
+    if not currency_id:
+        raise ValueError("No base currency configured")
+
+    return currency_id
+
+
+# Indian financial year quarters: Q1 Apr-Jun, Q2 Jul-Sep, Q3 Oct-Dec,
+# Q4 Jan-Mar of the following calendar year.
+_QUARTER_MONTHS = {
+    'Q1': (4, 6),
+    'Q2': (7, 9),
+    'Q3': (10, 12),
+    'Q4': (1, 3)
+}
+
+
+@lru_cache(maxsize=512)
+def _quarter_dates(quarter, financial_year):
+    """Start and end dates of a financial-year quarter, cached.
+
+    There are only four quarters per finite set of financial years, so
+    batch reporting over historic quarters hits the cache after the
+    first computation.
+    """
+    start_month, end_month = _QUARTER_MONTHS[quarter]
+    year = financial_year + 1 if quarter == 'Q4' else financial_year
+    start_date = date(year, start_month, 1)
+    if end_month == 12:
+        end_date = date(year, 12, 31)
+    else:
+        end_date = date(year, end_month + 1, 1) - timedelta(days=1)
+    return start_date, end_date
+
+
+class DoubleEntryBookkeeping:
+    """Handle double-entry bookkeeping operations"""
+
+    @staticmethod
+    @transaction.atomic
+    def create_journal_entry(hospital, debit_account_code, credit_account_code,
+                           amount_cents, description, reference_number,
+                           transaction_date=None, created_by=None,
+                           source_invoice=None, source_payment=None,
+                           source_expense=None, source_payroll=None):
+        """
+        Create a double-entry journal entry
+        """
+        if not transaction_date:
+            transaction_date = timezone.now().date()
+
+        # Resolve accounts and base currency through the per-hospital cache
+        debit_account_id = get_account_id(hospital.id, debit_account_code)
+        credit_account_id = get_account_id(hospital.id, credit_account_code)
+        currency_id = get_base_currency_id(hospital.id)
+
+        # Create ledger entry
+        ledger_entry = LedgerEntry.objects.create(
+            hospital=hospital,
+            transaction_date=transaction_date,
+            reference_number=reference_number,
+            description=description,
+            debit_account_id=debit_account_id,
+            credit_account_id=credit_account_id,
+            amount_cents=amount_cents,
+            currency_id=currency_id,
+            created_by=created_by,
+            invoice=source_invoice,
+            payment=source_payment,
+            expense=source_expense,
+            payroll=source_payroll
+        )
+        
+        return ledger_entry
+
+    @staticmethod
+    @transaction.atomic
+    def create_journal_entries_bulk(hospital, rows):
+        """
+        Persist several journal entries with one multi-row INSERT.
+
+        ``rows`` is a list of dicts using the same keys as
+        create_journal_entry (minus hospital). Accounts and the base
+        currency are resolved once for the whole batch.
+        """
+        if not rows:
+            return []
+
+        codes = {row['debit_account_code'] for row in rows}
+        codes.update(row['credit_account_code'] for row in rows)
+
+        accounts = {
+            account.account_code: account
+            for account in ChartOfAccounts.objects.filter(
+                hospital=hospital, account_code__in=codes, is_active=True
+            )
+        }
+        missing = codes - set(accounts)
+        if missing:
+            raise ValueError(f"Account not found: {', '.join(sorted(missing))}")
+
+        currency_id = get_base_currency_id(hospital.id)
+
+        default_date = timezone.now().date()
+        entries = [
+            LedgerEntry(
+                hospital=hospital,
+                transaction_date=row.get('transaction_date') or default_date,
+                reference_number=row['reference_number'],
+                description=row['description'],
+                debit_account=accounts[row['debit_account_code']],
+                credit_account=accounts[row['credit_account_code']],
+                amount_cents=row['amount_cents'],
+                currency_id=currency_id,
+                created_by=row.get('created_by'),
+                invoice=row.get('source_invoice'),
+                payment=row.get('source_payment'),
+                expense=row.get('source_expense'),
+                payroll=row.get('source_payroll')
+            )
+            for row in rows
+        ]
+
+        return LedgerEntry.objects.bulk_create(entries, batch_size=1000)
+
+    @staticmethod
+    def post_invoice_entries(invoice):
+        """Post accounting entries for an invoice"""
+        # Accounts Receivable Dr / Sales Cr
+        rows = [{
+            'debit_account_code': '1200',  # Accounts Receivable
+            'credit_account_code': '4000',  # Sales Revenue
+            'amount_cents': invoice.total_cents,
+            'description': f"Sales invoice {invoice.invoice_number}",
+            'reference_number': invoice.invoice_number,
+            'transaction_date': invoice.invoice_date,
+            'created_by': invoice.created_by,
+            'source_invoice': invoice
+        }]
+
+        # Cost of Sales entries if applicable. Filter in Python when the
+        # caller prefetched line items so no fresh query is issued per invoice
+        if 'items' in getattr(invoice, '_prefetched_objects_cache', {}):
+            costed_items = [item for item in invoice.items.all() if item.cost_price_cents > 0]
+        else:
+            costed_items = invoice.items.filter(cost_price_cents__gt=0)
+
+        for item in costed_items:
+            # Cost of Sales Dr / Inventory Cr
+            rows.append({
+                'debit_account_code': '5000',  # Cost of Sales
+                'credit_account_code': '1300',  # Inventory
+                'amount_cents': item.cost_price_cents * int(item.quantity),
+                'description': f"Cost of sales for {item.description}",
+                'reference_number': invoice.invoice_number,
+                'transaction_date': invoice.invoice_date,
+                'created_by': invoice.created_by,
+                'source_invoice': invoice
+            })
+
+        return DoubleEntryBookkeeping.create_journal_entries_bulk(invoice.hospital, rows)
+
+    @staticmethod
+    def post_payment_entries(payment):
+        """Post accounting entries for a payment"""
+        # Cash/Bank Dr / Accounts Receivable Cr
+        bank_account_code = '1100' if payment.payment_method == 'CASH' else '1150'
+        
+        entry = DoubleEntryBookkeeping.create_journal_entry(
+            hospital=payment.hospital,
+            debit_account_code=bank_account_code,
+            credit_account_code='1200',  # Accounts Receivable
+            amount_cents=payment.amount_cents,
+            description=f"Payment received - {payment.payment_number}",
+            reference_number=payment.payment_number,
+            transaction_date=payment.payment_date,
+            created_by=payment.received_by,
+            source_payment=payment
+        )
+        
+        # TDS entry if applicable
+        if payment.tds_cents > 0:
+            DoubleEntryBookkeeping.create_journal_entry(
+                hospital=payment.hospital,
+                debit_account_code='1400',  # TDS Receivable
+                credit_account_code='2300',  # TDS Payable
+                amount_cents=payment.tds_cents,
+                description=f"TDS on payment {payment.payment_number}",
+                reference_number=payment.payment_number,
+                transaction_date=payment.payment_date,
+                created_by=payment.received_by,
+                source_payment=payment
+            )
+        
+        return entry
+
+    # Expense category to expense account code, built once at import
+    EXPENSE_ACCOUNT_BY_CATEGORY = {
+        'MEDICAL_SUPPLIES': '5100',
+        'PHARMACEUTICALS': '5110',
+        'EQUIPMENT': '5120',
+        'UTILITIES': '6100',
+        'RENT': '6200',
+        'SALARIES': '6300',
+        'PROFESSIONAL_FEES': '6400',
+        'MAINTENANCE': '6500',
+        'INSURANCE': '6600',
+        'MARKETING': '6700',
+        'ADMINISTRATIVE': '6800',
+        'OTHER': '6900'
+    }
+
+    @staticmethod
+    def post_expense_entries(expense):
+        """Post accounting entries for expenses"""
+        # Expense Dr / Accounts Payable Cr
+        expense_account_code = DoubleEntryBookkeeping.EXPENSE_ACCOUNT_BY_CATEGORY.get(
+            expense.category, '6900'
+        )
+
+        entry = DoubleEntryBookkeeping.create_journal_entry(
+            hospital=expense.hospital,
+            debit_account_code=expense_account_code,
+            credit_account_code='2100',  # Accounts Payable
+            amount_cents=expense.amount_cents,
+            description=f"Expense - {expense.description}",
+            reference_number=expense.expense_number,
+            transaction_date=expense.expense_date,
+            created_by=expense.created_by,
+            source_expense=expense
+        )
+        
+        return entry
+
+    @staticmethod
+    def post_payroll_entries(payroll):
+        """Post accounting entries for payroll"""
+        employee_name = payroll.employee.get_full_name()
+
+        # Salary Expense Dr / Salary Payable Cr
+        rows = [{
+            'debit_account_code': '6300',  # Salary Expense
+            'credit_account_code': '2400',  # Salary Payable
+            'amount_cents': payroll.net_salary_cents,
+            'description': f"Salary for {employee_name}",
+            'reference_number': f"PAY-{payroll.id}",
+            'transaction_date': payroll.pay_date,
+            'created_by': payroll.created_by,
+            'source_payroll': payroll
+        }]
+
+        # Employer contributions
+        if payroll.pf_employer_cents > 0:
+            rows.append({
+                'debit_account_code': '6310',  # PF Expense
+                'credit_account_code': '2410',  # PF Payable
+                'amount_cents': payroll.pf_employer_cents,
+                'description': f"Employer PF contribution for {employee_name}",
+                'reference_number': f"PAY-{payroll.id}",
+                'transaction_date': payroll.pay_date,
+                'created_by': payroll.created_by,
+                'source_payroll': payroll
+            })
+
+        if payroll.esi_employer_cents > 0:
+            rows.append({
+                'debit_account_code': '6320',  # ESI Expense
+                'credit_account_code': '2420',  # ESI Payable
+                'amount_cents': payroll.esi_employer_cents,
+                'description': f"Employer ESI contribution for {employee_name}",
+                'reference_number': f"PAY-{payroll.id}",
+                'transaction_date': payroll.pay_date,
+                'created_by': payroll.created_by,
+                'source_payroll': payroll
+            })
+
+        return DoubleEntryBookkeeping.create_journal_entries_bulk(payroll.hospital, rows)
+
+
+def _anniversary(base_date, years_ahead):
+    """Anniversary of base_date, mapping Feb 29 to Feb 28 in common years"""
+    try:
+        return base_date.replace(year=base_date.year + years_ahead)
+    except ValueError:  # Feb 29 purchase date, non-leap target year
+        return base_date.replace(year=base_date.year + years_ahead, day=28)
+
+
+class DepreciationCalculator:
+    """Handle asset depreciation calculations"""
+
+    @staticmethod
+    def calculate_monthly_depreciation(asset):
+        """Calculate monthly depreciation for an asset"""
+        annual_depreciation = asset.calculate_annual_depreciation()
+        return annual_depreciation // 12
+    
+    @staticmethod
+    def generate_depreciation_schedule(asset):
+        """Generate complete depreciation schedule for an asset"""
+        schedule = []
+        current_book_value = asset.purchase_cost_cents
+        accumulated_depreciation = 0
+        depreciable_cents = asset.purchase_cost_cents - asset.salvage_value_cents
+        purchase_date = asset.purchase_date
+
+        # Hoist the per-year constants out of the loop: the straight-line
+        # amount and the declining rates never change across years
+        straight_line_annual = depreciable_cents // asset.useful_life_years
+        if asset.depreciation_method == 'REDUCING_BALANCE':
+            rate = asset.depreciation_rate / 100 if asset.depreciation_rate else (1 / asset.useful_life_years)
+        else:  # DOUBLE_DECLINING
+            rate = 2 / asset.useful_life_years
+
+        for year in range(asset.useful_life_years):
+            if asset.depreciation_method == 'STRAIGHT_LINE':
+                annual_depreciation = straight_line_annual
+            else:
+                annual_depreciation = int(current_book_value * rate)
+
+            # Ensure we don't depreciate below salvage value
+            if accumulated_depreciation + annual_depreciation > depreciable_cents:
+                annual_depreciation = depreciable_cents - accumulated_depreciation
+
+            accumulated_depreciation += annual_depreciation
+            current_book_value = asset.purchase_cost_cents - accumulated_depreciation
+            
+            schedule.append({
+                'year': year + 1,
+                'depreciation_amount': annual_depreciation,
+                'accumulated_depreciation': accumulated_depreciation,
+                'book_value': current_book_value,
+                'date': _anniversary(purchase_date, year + 1)
+            })
+            
+            if current_book_value <= asset.salvage_value_cents:
+                break
+        
+        return schedule
+
+    @staticmethod
+    @transaction.atomic
+    def process_monthly_depreciation(hospital, processing_date=None):
+        """Process depreciation for all assets for a given month"""
+        if not processing_date:
+            processing_date = timezone.now().date()
+        
+        active_assets = FixedAsset.objects.filter(
+            hospital=hospital,
+            is_active=True,
+            purchase_date__lt=processing_date
+        )
+
+        # One query for the assets already processed this month
+        already_processed = set(DepreciationSchedule.objects.filter(
+            hospital=hospital,
+            asset__in=active_assets,
+            depreciation_date__year=processing_date.year,
+            depreciation_date__month=processing_date.month
+        ).values_list('asset_id', flat=True))
+
+        month_tag = processing_date.strftime('%Y%m')
+        new_schedules = []
+        updated_assets = []
+        ledger_rows = []
+
+        # Stream only the columns the calculation reads, in bounded chunks
+        asset_stream = active_assets.only(
+            'id', 'asset_code', 'name', 'purchase_cost_cents', 'salvage_value_cents',
+            'useful_life_years', 'depreciation_method', 'depreciation_rate',
+            'accumulated_depreciation_cents', 'hospital'
+        ).iterator(chunk_size=500)
+
+        for asset in asset_stream:
+            if asset.id in already_processed:
+                continue
+
+            monthly_depreciation = DepreciationCalculator.calculate_monthly_depreciation(asset)
+            if monthly_depreciation <= 0:
+                continue
+
+            new_accumulated = asset.accumulated_depreciation_cents + monthly_depreciation
+            new_book_value = asset.purchase_cost_cents - new_accumulated
+
+            new_schedules.append(DepreciationSchedule(
+                hospital=hospital,
+                asset=asset,
+                depreciation_date=processing_date,
+                depreciation_amount_cents=monthly_depreciation,
+                accumulated_depreciation_cents=new_accumulated,
+                book_value_cents=new_book_value,
+                is_processed=True
+            ))
+
+            asset.accumulated_depreciation_cents = new_accumulated
+            asset.current_book_value_cents = new_book_value
+            updated_assets.append(asset)
+
+            ledger_rows.append({
+                'debit_account_code': '6900',  # Depreciation Expense
+                'credit_account_code': '1500',  # Accumulated Depreciation
+                'amount_cents': monthly_depreciation,
+                'description': f"Monthly depreciation for {asset.name}",
+                'reference_number': f"DEP-{asset.asset_code}-{month_tag}",
+                'transaction_date': processing_date
+            })
+
+        # Persist everything in three bulk statements. ignore_conflicts lets
+        # the per-month unique constraint absorb races with concurrent runs;
+        # the pre-fetched id set above keeps the asset updates correct
+        DepreciationSchedule.objects.bulk_create(
+            new_schedules, batch_size=1000, ignore_conflicts=True
+        )
+        FixedAsset.objects.bulk_update(
+            updated_assets,
+            ['accumulated_depreciation_cents', 'current_book_value_cents'],
+            batch_size=1000
+        )
+        DoubleEntryBookkeeping.create_journal_entries_bulk(hospital, ledger_rows)
+
+        return len(new_schedules)
+
+
+class TaxCalculator:
+    """Handle tax calculations"""
+    
+    @staticmethod
+    def calculate_gst(amount_cents, gst_rate, is_interstate=False):
+        """Calculate GST breakdown"""
+        gst_amount = int(amount_cents * gst_rate / 100)
+        
+        if is_interstate:
+            return {
+                'igst_cents': gst_amount,
+                'cgst_cents': 0,
+                'sgst_cents': 0,
+                'total_tax_cents': gst_amount
+            }
+        else:
+            # Split equally between CGST and SGST
+            cgst = gst_amount // 2
+            sgst = gst_amount - cgst  # Handle odd amounts
+            return {
+                'igst_cents': 0,
+                'cgst_cents': cgst,
+                'sgst_cents': sgst,
+                'total_tax_cents': cgst + sgst
+            }
+
+    @staticmethod
+    def calculate_gst_bulk(amounts_cents, gst_rate, is_interstate=False):
+        """Calculate GST for a batch of amounts in one pass.
+
+        Returns column lists instead of one dict per row, so bulk callers
+        (e.g. GSTR generation over many invoices) avoid the per-row dict
+        allocation of calculate_gst.
+        """
+        gst_amounts = [int(amount * gst_rate / 100) for amount in amounts_cents]
+
+        if is_interstate:
+            zeros = [0] * len(gst_amounts)
+            return {
+                'igst_cents': gst_amounts,
+                'cgst_cents': zeros,
+                'sgst_cents': list(zeros),
+                'total_tax_cents': list(gst_amounts)
+            }
+
+        # Split equally between CGST and SGST
+        cgst = [amount // 2 for amount in gst_amounts]
+        sgst = [amount - half for amount, half in zip(gst_amounts, cgst)]  # Handle odd amounts
+        return {
+            'igst_cents': [0] * len(gst_amounts),
+            'cgst_cents': cgst,
+            'sgst_cents': sgst,
+            'total_tax_cents': list(gst_amounts)
+        }
+
+    @staticmethod
+    def calculate_tds(gross_amount_cents, tds_rate):
+        """Calculate TDS amount"""
+        return int(gross_amount_cents * tds_rate / 100)
+
+    @staticmethod
+    def get_tax_liability_for_period(hospital, start_date, end_date, tax_type='GST'):
+        """Calculate tax liability for a specific period.
+
+        Sales, collected tax and input tax credit come back as scalar
+        subqueries on one hospital row, so the whole computation is a
+        single round trip.
+        """
+        invoices = AccountingInvoice.objects.filter(
+            hospital=models.OuterRef('pk'),
+            invoice_date__gte=start_date,
+            invoice_date__lte=end_date,
+            status__in=['PAID', 'PARTIAL']
+        ).values('hospital')
+
+        expenses = Expense.objects.filter(
+            hospital=models.OuterRef('pk'),
+            expense_date__gte=start_date,
+            expense_date__lte=end_date
+        ).values('hospital')
+
+        totals = Hospital.objects.filter(pk=hospital.pk).annotate(
+            total_sales=Coalesce(models.Subquery(
+                invoices.annotate(total=models.Sum('total_cents')).values('total')
+            ), 0),
+            total_tax=Coalesce(models.Subquery(
+                invoices.annotate(total=models.Sum('tax_cents')).values('total')
+            ), 0),
+            input_credit=Coalesce(models.Subquery(
+                expenses.annotate(total=models.Sum('tax_cents')).values('total')
+            ), 0)
+        ).values('total_sales', 'total_tax', 'input_credit').get()
+
+        total_sales = totals['total_sales']
+        total_tax_collected = totals['total_tax']
+        input_tax_credit = totals['input_credit']
+
+        net_tax_liability = total_tax_collected - input_tax_credit
+        
+        return {
+            'total_sales_cents': total_sales,
+            'taxable_sales_cents': total_sales,  # Simplified - all sales are taxable
+            'tax_collected_cents': total_tax_collected,
+            'input_tax_credit_cents': input_tax_credit,
+            'net_tax_liability_cents': net_tax_liability
+        }
+
+
+class ReportGenerator:
+    """Generate financial reports"""
+    
+    @staticmethod
+    def generate_trial_balance(hospital, as_of_date):
+        """Generate trial balance report in a single SQL query.
+
+        Grouped subqueries deliver per-account sums in one statement;
+        two filtered joins would cross-multiply the debit and credit
+        rows, so correlated subqueries are used instead. The footer
+        totals fall out of the same Python walk that assembles the rows.
+        """
+        debit_totals = LedgerEntry.objects.filter(
+            debit_account=models.OuterRef('pk'),
+            transaction_date__lte=as_of_date
+        ).values('debit_account').annotate(
+            total=models.Sum('amount_cents')
+        ).values('total')
+
+        credit_totals = LedgerEntry.objects.filter(
+            credit_account=models.OuterRef('pk'),
+            transaction_date__lte=as_of_date
+        ).values('credit_account').annotate(
+            total=models.Sum('amount_cents')
+        ).values('total')
+
+        accounts = ChartOfAccounts.objects.filter(
+            hospital=hospital, is_active=True
+        ).annotate(
+            debit_total=Coalesce(models.Subquery(debit_totals), 0),
+            credit_total=Coalesce(models.Subquery(credit_totals), 0)
+        ).values_list(
+            'account_code', 'account_name', 'account_type',
+            'debit_total', 'credit_total'
+        )
+
+        trial_balance = []
+        total_debits = 0
+        total_credits = 0
+
+        for account_code, account_name, account_type, debit_sum, credit_sum in accounts:
+            balance = debit_sum - credit_sum
+
+            if balance != 0:  # Only include accounts with balances
+                if balance > 0:
+                    debit_balance = balance
+                    credit_balance = 0
+                    total_debits += debit_balance
+                else:
+                    debit_balance = 0
+                    credit_balance = abs(balance)
+                    total_credits += credit_balance
+
+                trial_balance.append({
+                    'account_code': account_code,
+                    'account_name': account_name,
+                    'account_type': account_type,
+                    'debit_balance_cents': debit_balance,
+                    'credit_balance_cents': credit_balance
+                })
+        
+        return {
+            'accounts': trial_balance,
+            'total_debits': total_debits,
+            'total_credits': total_credits,
+            'is_balanced': total_debits == total_credits
+        }
+
+    @staticmethod
+    def quick_balance_check(hospital, as_of_date):
+        """Sanity-check the ledger with one aggregate query.
+
+        Each LedgerEntry posts the same amount_cents to a debit and a
+        credit account, so total debits equal total credits by
+        construction in this single-row double-entry schema. What the
+        scan can actually catch are malformed rows: non-positive
+        amounts and entries that debit and credit the same account.
+        """
+        totals = LedgerEntry.objects.filter(
+            hospital=hospital,
+            transaction_date__lte=as_of_date
+        ).aggregate(
+            total_cents=Coalesce(models.Sum('amount_cents'), 0),
+            nonpositive_entries=models.Count(
+                'pk', filter=models.Q(amount_cents__lte=0)),
+            self_balancing_entries=models.Count(
+                'pk', filter=models.Q(debit_account=models.F('credit_account'))),
+        )
+
+        return {
+            'total_debits': totals['total_cents'],
+            'total_credits': totals['total_cents'],
+            'nonpositive_entries': totals['nonpositive_entries'],
+            'self_balancing_entries': totals['self_balancing_entries'],
+            'is_balanced': (totals['nonpositive_entries'] == 0
+                            and totals['self_balancing_entries'] == 0),
+        }
+
+    @staticmethod
+    def generate_profit_loss(hospital, start_date, end_date):
+        """Generate Profit & Loss statement"""
+        accounts = ChartOfAccounts.objects.filter(
+            hospital=hospital,
+            account_type__in=['INCOME', 'EXPENSES'],
+            is_active=True
+        ).values_list('id', 'account_code', 'account_name', 'account_type')
+
+        entries = LedgerEntry.objects.filter(
+            hospital=hospital,
+            transaction_date__gte=start_date,
+            transaction_date__lte=end_date
+        )
+
+        debit_sums = dict(
+            entries.values_list('debit_account_id')
+            .annotate(total=models.Sum('amount_cents'))
+        )
+        credit_sums = dict(
+            entries.values_list('credit_account_id')
+            .annotate(total=models.Sum('amount_cents'))
+        )
+
+        total_income = 0
+        income_details = []
+        total_expenses = 0
+        expense_details = []
+
+        for account_id, account_code, account_name, account_type in accounts:
+            debit_sum = debit_sums.get(account_id, 0)
+            credit_sum = credit_sums.get(account_id, 0)
+
+            if account_type == 'INCOME':
+                net_income = credit_sum - debit_sum
+                total_income += net_income
+
+                if net_income != 0:
+                    income_details.append({
+                        'account_code': account_code,
+                        'account_name': account_name,
+                        'amount_cents': net_income
+                    })
+            else:
+                net_expense = debit_sum - credit_sum
+                total_expenses += net_expense
+
+                if net_expense != 0:
+                    expense_details.append({
+                        'account_code': account_code,
+                        'account_name': account_name,
+                        'amount_cents': net_expense
+                    })
+
+        net_profit = total_income - total_expenses
+        
+        return {
+            'period': f"{start_date} to {end_date}",
+            'income': income_details,
+            'expenses': expense_details,
+            'total_income_cents': total_income,
+            'total_expenses_cents': total_expenses,
+            'net_profit_cents': net_profit
+        }
+
+    @staticmethod
+    def generate_balance_sheet(hospital, as_of_date):
+        """Generate Balance Sheet"""
+        balance_sheet = {
+            'as_of_date': as_of_date,
+            'assets': {'current_assets': [], 'fixed_assets': [], 'total_assets_cents': 0},
+            'liabilities': {'current_liabilities': [], 'long_term_liabilities': [], 'total_liabilities_cents': 0},
+            'equity': {'equity_accounts': [], 'total_equity_cents': 0}
+        }
+        
+        accounts = list(ChartOfAccounts.objects.filter(
+            hospital=hospital,
+            account_type__in=['ASSETS', 'LIABILITIES', 'EQUITY'],
+            is_active=True
+        ).values_list('id', 'account_code', 'account_name', 'account_type', 'account_subtype'))
+
+        # All balances in one batched lookup instead of account.balance per row
+        balances = ChartOfAccounts.balances_for(
+            hospital, [account[0] for account in accounts], as_of_date=as_of_date
+        )
+
+        for account_id, account_code, account_name, account_type, account_subtype in accounts:
+            balance = balances.get(account_id, 0)
+            account_data = {
+                'account_code': account_code,
+                'account_name': account_name,
+                'amount_cents': balance
+            }
+
+            if account_type == 'ASSETS' and balance > 0:
+                if account_subtype == 'CURRENT_ASSETS':
+                    balance_sheet['assets']['current_assets'].append(account_data)
+                else:
+                    balance_sheet['assets']['fixed_assets'].append(account_data)
+
+                balance_sheet['assets']['total_assets_cents'] += balance
+
+            elif account_type == 'LIABILITIES' and balance > 0:
+                if account_subtype == 'CURRENT_LIABILITIES':
+                    balance_sheet['liabilities']['current_liabilities'].append(account_data)
+                else:
+                    balance_sheet['liabilities']['long_term_liabilities'].append(account_data)
+
+                balance_sheet['liabilities']['total_liabilities_cents'] += balance
+
+            elif account_type == 'EQUITY' and balance != 0:
+                balance_sheet['equity']['equity_accounts'].append(account_data)
+                balance_sheet['equity']['total_equity_cents'] += balance
+
+        return balance_sheet
+
+
+# Tally voucher markup built once at import; values are escaped per render
+_TALLY_ENVELOPE = (
+    '<ENVELOPE><HEADER><TALLYREQUEST>Import Data</TALLYREQUEST></HEADER>'
+    '<BODY><IMPORTDATA><REQUESTDESC><REPORTNAME>Vouchers</REPORTNAME></REQUESTDESC>'
+    '<REQUESTDATA>{vouchers}</REQUESTDATA></IMPORTDATA></BODY></ENVELOPE>'
+)
+
+_TALLY_SALES_VOUCHER = (
+    '<TALLYMESSAGE><VOUCHER><VOUCHERTYPENAME>Sales</VOUCHERTYPENAME>'
+    '<PARTYLEDGERNAME>{party}</PARTYLEDGERNAME><DATE>{date}</DATE>'
+    '<AMOUNT>{amount}</AMOUNT></VOUCHER></TALLYMESSAGE>'
+)
+
+_TALLY_PURCHASE_VOUCHER = (
+    '<TALLYMESSAGE><VOUCHER><VOUCHERTYPENAME>Purchase</VOUCHERTYPENAME>'
+    '</VOUCHER></TALLYMESSAGE>'
+)
+
+
+class ExportEngine:
+    """Handle various export formats"""
+
+    @staticmethod
+    def export_to_excel(data, headers, filename):
+        """Export data to Excel format, streaming rows via a write-only workbook"""
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
+
+        # Header styling
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        border = Border(
+            left=Side(border_style="thin"),
+            right=Side(border_style="thin"),
+            top=Side(border_style="thin"),
+            bottom=Side(border_style="thin")
+        )
+
+        # Write-only sheets cannot be restyled after the fact, so compute
+        # per-column widths in one pass over the raw rows before writing
+        max_lens = [len(str(header)) for header in headers]
+        for row_data in data:
+            for col_idx, value in enumerate(row_data):
+                value_len = len(str(value))
+                if value_len > max_lens[col_idx]:
+                    max_lens[col_idx] = value_len
+
+        for col, max_len in enumerate(max_lens, 1):
+            worksheet.column_dimensions[get_column_letter(col)].width = min(max_len + 2, 50)
+
+        # Write headers
+        header_row = []
+        for header in headers:
+            cell = WriteOnlyCell(worksheet, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.border = border
+            header_row.append(cell)
+        worksheet.append(header_row)
+
+        # Write data, one buffered row at a time
+        for row_data in data:
+            row = []
+            for value in row_data:
+                cell = WriteOnlyCell(worksheet, value=value)
+                cell.border = border
+                row.append(cell)
+            worksheet.append(row)
+
+        # Save to BytesIO
+        excel_buffer = io.BytesIO()
+        workbook.save(excel_buffer)
+        excel_buffer.seek(0)
+
+        return excel_buffer
+
+    @staticmethod
+    def export_to_tally_xml(transactions, export_type='SALES'):
+        """Export to Tally-compatible XML format"""
+        vouchers = []
+
+        for transaction in transactions:
+            if export_type == 'SALES':
+                vouchers.append(_TALLY_SALES_VOUCHER.format(
+                    party=escape(transaction.get('party_name', '')),
+                    date=transaction.get('date', '').strftime('%Y%m%d'),
+                    amount=transaction.get('amount_cents', 0) / 100
+                ))
+            elif export_type == 'PURCHASE':
+                vouchers.append(_TALLY_PURCHASE_VOUCHER)
+            # Add other voucher types as needed
+
+        return _TALLY_ENVELOPE.format(vouchers=''.join(vouchers))
+
+    @staticmethod
+    def export_gst_returns(hospital, start_date, end_date, return_type='GSTR1'):
+        """Export GST returns in JSON format"""
+        if return_type == 'GSTR1':
+            # B2B supplies
+            b2b_supplies = []
+            invoices = AccountingInvoice.objects.filter(
+                hospital=hospital,
+                invoice_date__gte=start_date,
+                invoice_date__lte=end_date,
+                invoice_type='CORPORATE'
+            ).select_related('customer').only(
+                'invoice_number', 'invoice_date', 'total_cents', 'customer__gstin'
+            )
+
+            for invoice in invoices:
+                if invoice.customer and invoice.customer.gstin:
+                    b2b_supplies.append({
+                        "ctin": invoice.customer.gstin,
+                        "inv": [{
+                            "inum": invoice.invoice_number,
+                            "idt": invoice.invoice_date.strftime('%d-%m-%Y'),
+                            "val": invoice.total_cents / 100,
+                            "pos": "07",  # Place of supply - needs to be configured
+                            "rchrg": "N",
+                            "inv_typ": "R",
+                            "itms": []
+                        }]
+                    })
+            
+            return {
+                "gstin": "",  # Hospital's GSTIN - needs to be configured
+                "ret_period": start_date.strftime('%m%Y'),
+                "b2b": b2b_supplies
+            }
+        
+        # Add other GST return types as needed
+        return {}
+
+
+class AgeingReportGenerator:
+    """Generate ageing reports for receivables and payables"""
+    
+    @staticmethod
+    def _bucket_label(as_of_date):
+        """Case expression labelling each invoice's ageing bucket in SQL"""
+        # Range predicates on due_date are index-friendly, unlike per-row
+        # date arithmetic.
+        return models.Case(
+            models.When(due_date__gte=as_of_date - timedelta(days=30), then=models.Value('0-30')),
+            models.When(due_date__gte=as_of_date - timedelta(days=60), then=models.Value('31-60')),
+            models.When(due_date__gte=as_of_date - timedelta(days=90), then=models.Value('61-90')),
+            default=models.Value('90+'),
+            output_field=models.CharField()
+        )
+
+    @staticmethod
+    def generate_receivables_ageing(hospital, as_of_date):
+        """Generate ageing report for accounts receivable"""
+        # Bucket on due_date thresholds in SQL so the database both labels
+        # and totals each bucket.
+        bucket_label = AgeingReportGenerator._bucket_label(as_of_date)
+        unpaid_invoices = AccountingInvoice.objects.using(reporting_db()).filter(
+            hospital=hospital,
+            status__in=['SENT', 'OVERDUE', 'PARTIAL'],
+            balance_cents__gt=0
+        ).annotate(bucket=bucket_label)
+
+        ageing_buckets = {
+            '0-30': [], '31-60': [], '61-90': [], '90+': []
+        }
+
+        # One pass over flat dict rows; customer/patient names come back
+        # via the same joins instead of per-row FK dereferences.
+        detail_rows = unpaid_invoices.values(
+            'invoice_number', 'invoice_date', 'due_date',
+            'total_cents', 'balance_cents', 'bucket',
+            'customer__customer_code', 'customer__name',
+            'patient__last_name', 'patient__first_name',
+            'patient__medical_record_number'
+        )
+        # Stream rather than materialize the result cache; hospitals can
+        # carry six-figure open invoice counts.
+        for row in detail_rows.iterator(chunk_size=2000):
+            if row['customer__name']:
+                party = f"{row['customer__customer_code']} - {row['customer__name']}"
+            else:
+                party = (f"{row['patient__last_name']}, {row['patient__first_name']} "
+                         f"(MRN: {row['patient__medical_record_number']})")
+            ageing_buckets[row['bucket']].append({
+                'invoice_number': row['invoice_number'],
+                'customer': party,
+                'invoice_date': row['invoice_date'],
+                'due_date': row['due_date'],
+                'total_cents': row['total_cents'],
+                'balance_cents': row['balance_cents'],
+                'days_outstanding': (as_of_date - row['due_date']).days
+            })
+
+        bucket_totals = {bucket: 0 for bucket in ageing_buckets}
+        grouped = unpaid_invoices.values('bucket').annotate(
+            total=models.Sum('balance_cents')
+        )
+        for row in grouped:
+            bucket_totals[row['bucket']] = row['total']
+
+        return {
+            'as_of_date': as_of_date,
+            'ageing_buckets': ageing_buckets,
+            'bucket_totals': bucket_totals,
+            'grand_total': sum(bucket_totals.values())
+        }
+
+    @staticmethod
+    def materialize_receivables_ageing(hospital, as_of_date=None):
+        """Recompute and upsert the ageing bucket totals for one hospital"""
+        if as_of_date is None:
+            as_of_date = timezone.now().date()
+
+        grouped = AccountingInvoice.objects.filter(
+            hospital=hospital,
+            status__in=['SENT', 'OVERDUE', 'PARTIAL'],
+            balance_cents__gt=0
+        ).annotate(
+            bucket=AgeingReportGenerator._bucket_label(as_of_date)
+        ).values('bucket').annotate(
+            total=models.Sum('balance_cents'),
+            count=models.Count('id')
+        )
+        totals = {row['bucket']: row for row in grouped}
+
+        # Write all four buckets, zeroing those with no invoices, so stale
+        # totals from a previous refresh cannot linger.
+        rows = [
+            ReceivablesAgeingSummary(
+                hospital=hospital,
+                as_of_date=as_of_date,
+                bucket=bucket,
+                total_cents=totals.get(bucket, {}).get('total', 0),
+                invoice_count=totals.get(bucket, {}).get('count', 0)
+            )
+            for bucket, _label in ReceivablesAgeingSummary.AGEING_BUCKETS
+        ]
+        ReceivablesAgeingSummary.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['hospital', 'as_of_date', 'bucket'],
+            update_fields=['total_cents', 'invoice_count']
+        )
+
+    @staticmethod
+    def receivables_ageing_summary(hospital, as_of_date):
+        """Read the materialized bucket totals (no invoice scan)"""
+        bucket_totals = {
+            bucket: 0 for bucket, _label in ReceivablesAgeingSummary.AGEING_BUCKETS
+        }
+        for row in ReceivablesAgeingSummary.objects.filter(
+            hospital=hospital, as_of_date=as_of_date
+        ).values('bucket', 'total_cents'):
+            bucket_totals[row['bucket']] = row['total_cents']
+        return {
+            'as_of_date': as_of_date,
+            'bucket_totals': bucket_totals,
+            'grand_total': sum(bucket_totals.values())
+        }
+
+
+class BankReconciliationHelper:
+    """Help with bank reconciliation"""
+    
+    @staticmethod
+    def auto_match_transactions(bank_account, tolerance_cents=100):
+        """Auto-match bank transactions with payments/expenses"""
+        bank_txns = list(BankTransaction.objects.filter(
+            bank_account=bank_account,
+            is_reconciled=False
+        ).only('id', 'transaction_type', 'transaction_date', 'amount_cents'))
+        if not bank_txns:
+            return 0
+
+        # Load all candidates for the statement's dates in two queries and
+        # match in memory, instead of issuing count()/first() per bank txn.
+        # The denormalized is_matched flag (kept current by both the bulk
+        # and manual reconciliation paths) turns the already-matched
+        # exclusion into a plain predicate over the partial unmatched
+        # indexes — no bank transaction join at all.
+        #
+        # Candidates are bucketed by (date, amount // bucket_width) with
+        # the width covering the whole tolerance window, so each bank txn
+        # probes at most three buckets instead of scanning the full
+        # candidate list for its date.
+        bucket_width = max(2 * tolerance_cents, 1)
+        txn_dates = {txn.transaction_date for txn in bank_txns}
+        payment_buckets = {}
+        for payment_id, payment_date, amount_cents in AccountingPayment.objects.filter(
+            bank_account=bank_account,
+            payment_date__in=txn_dates,
+            status='CLEARED',
+            is_matched=False
+        ).values_list('id', 'payment_date', 'amount_cents'):
+            key = (payment_date, amount_cents // bucket_width)
+            payment_buckets.setdefault(key, []).append((payment_id, amount_cents))
+        expense_buckets = {}
+        # Expenses match on net_amount_cents (amount + tax - tds), the
+        # figure that actually left the bank, same as before batching.
+        for expense_id, payment_date, net_amount_cents in Expense.objects.filter(
+            payment_date__in=txn_dates,
+            is_paid=True,
+            is_matched=False
+        ).values_list('id', 'payment_date', 'net_amount_cents'):
+            key = (payment_date, net_amount_cents // bucket_width)
+            expense_buckets.setdefault(key, []).append((expense_id, net_amount_cents))
+
+        matched = []
+        matched_at = timezone.now()
+
+        for bank_txn in bank_txns:
+            if bank_txn.transaction_type == 'CREDIT':
+                buckets = payment_buckets
+            else:
+                buckets = expense_buckets
+
+            slot = bank_txn.amount_cents // bucket_width
+            in_window = []
+            for neighbor in (slot - 1, slot, slot + 1):
+                for candidate in buckets.get((bank_txn.transaction_date, neighbor), ()):
+                    if abs(candidate[1] - bank_txn.amount_cents) <= tolerance_cents:
+                        in_window.append((neighbor, candidate))
+            # Ambiguous amounts still need manual reconciliation
+            if len(in_window) != 1:
+                continue
+
+            neighbor, match = in_window[0]
+            buckets[(bank_txn.transaction_date, neighbor)].remove(match)
+            if bank_txn.transaction_type == 'CREDIT':
+                bank_txn.reconciled_payment_id = match[0]
+            else:
+                bank_txn.reconciled_expense_id = match[0]
+            bank_txn.is_reconciled = True
+            bank_txn.reconciled_at = matched_at
+            matched.append(bank_txn)
+
+        # One batched UPDATE instead of a save() per match. This also
+        # sidesteps BankTransaction.save(), which re-applies the amount
+        # to the account balance — wrong for a reconciliation-only write.
+        if matched:
+            with transaction.atomic():
+                BankTransaction.objects.bulk_update(
+                    matched,
+                    ['reconciled_payment', 'reconciled_expense', 'is_reconciled', 'reconciled_at'],
+                    batch_size=1000
+                )
+                AccountingPayment.objects.filter(
+                    id__in=[t.reconciled_payment_id for t in matched if t.reconciled_payment_id]
+                ).update(is_matched=True)
+                Expense.objects.filter(
+                    id__in=[t.reconciled_expense_id for t in matched if t.reconciled_expense_id]
+                ).update(is_matched=True)
+
+        return len(matched)
+
+
+class ComplianceReporter:
+    """Generate compliance reports"""
+    
+    @staticmethod
+    def generate_tds_return(hospital, quarter, financial_year):
+        """Generate TDS return data"""
+        from .models import TDSEntry
+
+        start_date, end_date = _quarter_dates(quarter, financial_year)
+
+        # Group and sum per section/deductee in the database; deductee
+        # names and PANs come back through the same joins instead of
+        # per-entry vendor/employee dereferences.
+        # Quarterly returns scan a full quarter of entries; read from the
+        # replica when one is configured.
+        entries = TDSEntry.objects.using(reporting_db()).filter(
+            hospital=hospital,
+            deduction_date__gte=start_date,
+            deduction_date__lte=end_date
+        )
+        rows = entries.values(
+            'section', 'vendor_id', 'employee_id',
+            'vendor__name', 'vendor__pan',
+            'employee__first_name', 'employee__last_name',
+            'employee__username'
+        ).annotate(
+            gross_amount_cents=models.Sum('gross_amount_cents'),
+            tds_amount_cents=models.Sum('tds_amount_cents')
+        )
+
+        tds_entries = []
+        for row in rows.iterator(chunk_size=2000):
+            if row['vendor_id']:
+                deductee = row['vendor__name']
+            else:
+                deductee = (f"{row['employee__first_name']} {row['employee__last_name']}".strip()
+                            or row['employee__username'])
+            tds_entries.append({
+                'section': row['section'],
+                'deductee': deductee,
+                'pan': row['vendor__pan'] or '',
+                'gross_amount_cents': row['gross_amount_cents'],
+                'tds_amount_cents': row['tds_amount_cents']
+            })
+
+        return {
+            'quarter': quarter,
+            'financial_year': financial_year,
+            'start_date': start_date,
+            'end_date': end_date,
+            'tds_entries': tds_entries,
+            # The grand total rides the same index scan as the grouped
+            # query, so ask the database rather than re-summing in Python.
+            'total_tds_cents': entries.aggregate(
+                total=models.Sum('tds_amount_cents')
+            )['total'] or 0
+        }
@@ -290,6 +290,69 @@ class AssetRegister(TimeStampedModel):
     def accumulated_depreciation(self):
         return self.total_cost - self.current_book_value
 
+    @classmethod
+    def bulk_book_values(cls, queryset, today=None):
+        """Compute book values for a whole register in one query.
+
+        Portfolio reports calling the current_book_value property per asset
+        re-fetch each row and redo the date lookup every time. This pulls
+        only the depreciation inputs via values_list and runs the same
+        formulas in plain float arithmetic, returning {id: book_value}.
+        """
+        if today is None:
+            today = timezone.now().date()
+
+        book_values = {}
+        rows = queryset.values_list(
+            'id', 'purchase_amount', 'installation_cost', 'salvage_value',
+            'useful_life_years', 'depreciation_rate', 'depreciation_method',
+            'commissioning_date', 'purchase_date'
+        )
+        for (asset_id, purchase_amount, installation_cost, salvage_value,
+                useful_life_years, depreciation_rate, method,
+                commissioning_date, purchase_date) in rows:
+            total_cost = float(purchase_amount + installation_cost)
+            salvage = float(salvage_value)
+            years_elapsed = (today - (commissioning_date or purchase_date)).days / 365.25
+
+            if method == 'STRAIGHT_LINE':
+                annual = (total_cost - salvage) / useful_life_years
+                total_depreciation = min(annual * years_elapsed, total_cost - salvage)
+            elif method == 'WRITTEN_DOWN':
+                rate = float(depreciation_rate) / 100
+                total_depreciation = total_cost * (1 - (1 - rate) ** years_elapsed)
+            else:
+                # Double declining balance
+                rate = 2 / useful_life_years
+                total_depreciation = total_cost * (1 - (1 - rate) ** years_elapsed)
+
+            book_values[asset_id] = round(max(total_cost - total_depreciation, salvage), 2)
+
+        return book_values
+
+
+class ProfitLossStatementQuerySet(models.QuerySet):
+    """Queryset helpers for P&L reporting"""
+
+    def with_totals(self):
+        """Annotate the revenue/cost subtotals in the same query.
+
+        Company-wide reports read these off every row; computing them as
+        part of the SELECT avoids a Python Decimal addition chain per
+        instance.
+        """
+        return self.annotate(
+            total_revenue=(models.F('patient_revenue') + models.F('insurance_revenue') +
+                           models.F('referral_revenue') + models.F('other_revenue')),
+            total_direct_costs=(models.F('staff_costs') + models.F('medical_supplies') +
+                                models.F('equipment_depreciation')),
+            total_indirect_costs=(models.F('utilities') + models.F('maintenance') +
+                                  models.F('administrative_costs')),
+            total_other_expenses=(models.F('marketing_costs') + models.F('finance_costs') +
+                                  models.F('other_expenses'))
+        )
+
+
 class ProfitLossStatement(TimeStampedModel):
     """Department-wise P&L statements"""
     hospital = models.ForeignKey('hospitals.Hospital', on_delete=models.CASCADE)
@@ -337,7 +400,9 @@ class ProfitLossStatement(TimeStampedModel):
     is_finalized = models.BooleanField(default=False)
     finalized_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True)
     finalized_at = models.DateTimeField(null=True, blank=True)
-    
+
+    objects = ProfitLossStatementQuerySet.as_manager()
+
     class Meta:
         unique_together = ['hospital', 'department', 'period_start', 'period_end']
         indexes = [
@@ -348,32 +413,36 @@ class ProfitLossStatement(TimeStampedModel):
     def __str__(self):
         return f"{self.department} P&L - {self.period_start} to {self.period_end}"
     
-    @property
-    def total_revenue(self):
-        return (self.patient_revenue + self.insurance_revenue + 
-                self.referral_revenue + self.other_revenue)
-    
-    @property
-    def total_direct_costs(self):
-        return (self.staff_costs + self.medical_supplies + 
-                self.equipment_depreciation)
-    
-    @property
-    def total_indirect_costs(self):
-        return (self.utilities + self.maintenance + 
-                self.administrative_costs)
-    
-    @property
-    def total_other_expenses(self):
-        return (self.marketing_costs + self.finance_costs + 
-                self.other_expenses)
-    
+    @classmethod
+    def bulk_calculate(cls, queryset):
+        """Recompute profit figures for a whole queryset in one UPDATE.
+
+        Month-end runs touch every department's statement; evaluating the
+        sums as F() expressions lets the database do the arithmetic in a
+        single round trip instead of a fetch/compute/save per row.
+        """
+        revenue = (models.F('patient_revenue') + models.F('insurance_revenue') +
+                   models.F('referral_revenue') + models.F('other_revenue'))
+        direct = (models.F('staff_costs') + models.F('medical_supplies') +
+                  models.F('equipment_depreciation'))
+        indirect = (models.F('utilities') + models.F('maintenance') +
+                    models.F('administrative_costs'))
+        other = (models.F('marketing_costs') + models.F('finance_costs') +
+                 models.F('other_expenses'))
+        return queryset.update(
+            gross_profit=revenue - direct,
+            operating_profit=revenue - direct - indirect,
+            net_profit=revenue - direct - indirect - other
+        )
+
     def calculate_profits(self):
-        """Calculate and update profit figures"""
-        self.gross_profit = self.total_revenue - self.total_direct_costs
-        self.operating_profit = self.gross_profit - self.total_indirect_costs
-        self.net_profit = self.operating_profit - self.total_other_expenses
-        self.save()
+        """Calculate and update profit figures for this statement"""
+        type(self).bulk_calculate(
+            type(self).objects.filter(pk=self.pk)
+        )
+        self.refresh_from_db(
+            fields=['gross_profit', 'operating_profit', 'net_profit']
+        )
 
 class BreakEvenAnalysis(TimeStampedModel):
     """Break-even analysis for departments/services"""
@@ -422,9 +491,29 @@ class BreakEvenAnalysis(TimeStampedModel):
             if self.current_monthly_units > 0:
                 safety_units = self.current_monthly_units - self.breakeven_units
                 self.margin_of_safety_percentage = (safety_units / self.current_monthly_units) * 100
-        
+
         self.save()
 
+    @staticmethod
+    def scenario(fixed_costs, variable_costs, prices):
+        """Break-even units for parallel arrays of what-if inputs.
+
+        Takes equal-length sequences of fixed cost, variable cost per
+        unit, and selling price candidates and returns the break-even
+        unit count for each, inf where the contribution margin is not
+        positive. Works on plain floats so scenario sweeps skip model
+        instances and Decimal arithmetic entirely; nothing is persisted.
+        """
+        results = []
+        for fixed, variable, price in zip(fixed_costs, variable_costs, prices):
+            contribution = float(price) - float(variable)
+            if contribution > 0:
+                results.append(float(fixed) / contribution)
+            else:
+                results.append(float('inf'))
+        return results
+
+
 class TallyVoucherMapping(TimeStampedModel):
     """Mapping HMS transactions to Tally vouchers"""
     hospital = models.ForeignKey('hospitals.Hospital', on_delete=models.CASCADE)
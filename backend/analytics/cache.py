@@ -0,0 +1,28 @@
+"""
+Cache keys and invalidation for analytics payloads.
+"""
+
+from django.core.cache import cache
+from django.utils import timezone
+
+OVERVIEW_TTL_SECONDS = 60
+
+
+def overview_cache_key(scope, day=None):
+    """Key for one scope's overview payload.
+
+    The scope is a hospital id for tenant users or 'all' for the
+    superadmin cross-hospital view; a tenant user without a hospital is
+    kept distinct from 'all' so the two can never share a payload.
+    """
+    if day is None:
+        day = timezone.localdate()
+    return f'analytics:overview:{scope}:{day.isoformat()}'
+
+
+def invalidate_overview(hospital_id):
+    """Drop the cached overview for a hospital and the cross-hospital view"""
+    cache.delete_many([
+        overview_cache_key(hospital_id),
+        overview_cache_key('all'),
+    ])
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:34
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('hospitals', '0002_plan_hospitalplan'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HospitalDailyRevenue',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('day', models.DateField()),
+                ('revenue_cents', models.BigIntegerField(default=0)),
+                ('hospital', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='%(app_label)s_%(class)ss', to='hospitals.hospital')),
+            ],
+            options={
+                'ordering': ['-day'],
+                'unique_together': {('hospital', 'day')},
+            },
+        ),
+    ]
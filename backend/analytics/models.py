@@ -1,3 +1,50 @@
 from django.db import models
+from django.db.models import Sum
+from django.db.models.functions import TruncDate
+from core.models import TenantModel
 
 # Create your models here.
+
+
+class HospitalDailyRevenue(TenantModel):
+    """Per-day rollup of billed revenue, one row per hospital per day.
+
+    Maintained incrementally by a Celery task queued on bill writes,
+    with a nightly full rebuild; the overview dashboard sums these rows
+    instead of aggregating the whole bill table per request.
+    """
+    day = models.DateField()
+    revenue_cents = models.BigIntegerField(default=0)
+
+    class Meta:
+        unique_together = ('hospital', 'day')
+        ordering = ['-day']
+
+    def __str__(self):
+        return f"{self.hospital_id} {self.day}: {self.revenue_cents}"
+
+    @classmethod
+    def rebuild(cls, hospital_id=None):
+        """Recompute rollup rows from bills, for one hospital or all"""
+        from billing.models import Bill
+
+        bills = Bill.objects.all()
+        if hospital_id is not None:
+            bills = bills.filter(hospital_id=hospital_id)
+
+        grouped = bills.annotate(day=TruncDate('created_at')).values(
+            'hospital_id', 'day'
+        ).annotate(total=Sum('paid_cents'))
+
+        rows = [
+            cls(hospital_id=row['hospital_id'], day=row['day'],
+                revenue_cents=row['total'] or 0)
+            for row in grouped
+        ]
+        cls.objects.bulk_create(
+            rows,
+            update_conflicts=True,
+            unique_fields=['hospital', 'day'],
+            update_fields=['revenue_cents'],
+            batch_size=1000
+        )
@@ -0,0 +1,45 @@
+"""
+Signals keeping the analytics rollups current with billing writes.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from appointments.models import Appointment
+from billing.models import Bill
+from patients.models import Patient
+
+from .cache import invalidate_overview
+
+
+@receiver(post_save, sender=Bill)
+@receiver(post_save, sender=Appointment)
+@receiver(post_save, sender=Patient)
+def drop_overview_cache(sender, instance, **kwargs):
+    """Evict the cached overview payload when its inputs change"""
+    try:
+        invalidate_overview(instance.hospital_id)
+    except Exception as e:
+        # Cache backend trouble shouldn't block the write; the entry
+        # expires on its own within the TTL anyway.
+        print(f"Error invalidating overview cache for hospital {instance.hospital_id}: {e}")
+
+
+@receiver(post_save, sender=Bill)
+def queue_revenue_refresh(sender, instance, **kwargs):
+    """Refresh the daily revenue rollup when a bill changes"""
+    hospital_id = instance.hospital_id
+
+    def enqueue():
+        from .tasks import refresh_daily_revenue
+        try:
+            refresh_daily_revenue.delay(hospital_id)
+        except Exception as e:
+            # A down broker shouldn't block billing writes; the nightly
+            # rebuild will catch the rollup up.
+            print(f"Error queueing revenue refresh for hospital {hospital_id}: {e}")
+
+    # Enqueue only once the bill write commits, so the worker cannot
+    # read the table before the row is visible.
+    transaction.on_commit(enqueue)
@@ -0,0 +1,15 @@
+from celery import shared_task
+
+from .models import HospitalDailyRevenue
+
+
+@shared_task
+def refresh_daily_revenue(hospital_id):
+    """Recompute the daily revenue rollup for one hospital"""
+    HospitalDailyRevenue.rebuild(hospital_id)
+
+
+@shared_task
+def rebuild_daily_revenue_all_hospitals():
+    """Nightly full rebuild of the revenue rollup across hospitals"""
+    HospitalDailyRevenue.rebuild()
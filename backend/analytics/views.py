@@ -1,18 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections
 from django.db.models import Sum
 from django.utils import timezone
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from drf_spectacular.utils import extend_schema, OpenApiResponse
-from billing.models import Bill
+from django.core.cache import cache
+
+from core.routers import reporting_db
 from patients.models import Patient
 from appointments.models import Appointment
+from .cache import OVERVIEW_TTL_SECONDS, overview_cache_key
+from .models import HospitalDailyRevenue
 from .serializers import OverviewStatsSerializer
 
 
 # Create your views here.
 
 
+def _run_query(fn):
+    """Run an ORM call on a worker thread and release its connection"""
+    try:
+        return fn()
+    finally:
+        connections.close_all()
+
+
 class OverviewStatsView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -22,12 +37,32 @@ class OverviewStatsView(APIView):
         filters = {}
         if not (user.is_superuser or getattr(user, 'role', None) == 'SUPER_ADMIN'):
             filters['hospital_id'] = getattr(user, 'hospital_id', None)
-        patients_count = Patient.objects.filter(**filters).count()
         today = timezone.localdate()
-        appointments_today = Appointment.objects.filter(**filters, start_at__date=today).count()
-        revenue_cents = Bill.objects.filter(**filters).aggregate(total=Sum('paid_cents'))['total'] or 0
-        return Response({
-            'patients_count': patients_count,
-            'appointments_today': appointments_today,
-            'revenue_cents': revenue_cents,
-        })
+        # The payload changes far less often than it is requested; serve
+        # it from cache for up to a minute per hospital. Writes to the
+        # underlying tables invalidate the key early (see signals).
+        cache_key = overview_cache_key(filters.get('hospital_id', 'all'), today)
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+        # The three stats hit independent tables; run them concurrently so
+        # the response waits on the slowest query instead of the sum of all
+        # three round trips. Each worker thread opens its own connection.
+        db = reporting_db()
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            patients_future = pool.submit(
+                _run_query, Patient.objects.using(db).filter(**filters).count)
+            appointments_future = pool.submit(
+                _run_query,
+                Appointment.objects.using(db).filter(**filters, start_at__date=today).count)
+            revenue_future = pool.submit(
+                _run_query,
+                lambda: HospitalDailyRevenue.objects.using(db).filter(**filters).aggregate(
+                    total=Sum('revenue_cents')))
+        data = {
+            'patients_count': patients_future.result(),
+            'appointments_today': appointments_future.result(),
+            'revenue_cents': revenue_future.result()['total'] or 0,
+        }
+        cache.set(cache_key, data, OVERVIEW_TTL_SECONDS)
+        return Response(data)
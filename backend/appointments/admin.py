@@ -1,19 +1,61 @@
 from django.contrib import admin
+from django.contrib.admin.views.main import ChangeList
+from core.admin_filters import (
+    CachedRelatedFieldListFilter, CachedRelatedOnlyFieldListFilter
+)
+from core.paginators import EstimatedCountPaginator
 from .models import (
     Appointment, AppointmentTemplate, Resource, WaitList,
     AppointmentReminder, AppointmentHistory
 )
 
 
+class AppointmentChangeList(ChangeList):
+    """Changelist with a narrow projection.
+
+    Appointment rows carry wide text columns (reason, chief_complaint,
+    clinical_notes, telehealth_link) that the changelist never shows;
+    only() keeps the projection to the list_display columns and the
+    fields the related __str__ methods render. Scoped to the changelist
+    so the change form still loads full rows.
+    """
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).only(
+            'id', 'start_at', 'end_at', 'status', 'appointment_type',
+            'patient__first_name', 'patient__last_name',
+            'patient__medical_record_number',
+            'primary_provider__first_name', 'primary_provider__middle_name',
+            'primary_provider__last_name', 'primary_provider__suffix',
+            'primary_provider__employee_id', 'primary_provider__username',
+            'hospital__name', 'hospital__code',
+        )
+
+
 @admin.register(Appointment)
 class AppointmentAdmin(admin.ModelAdmin):
     list_display = ("patient", "primary_provider", "hospital", "start_at", "end_at", "status", "appointment_type")
-    list_filter = ("hospital", "primary_provider", "status", "appointment_type", "priority")
+    list_filter = (
+        ("hospital", CachedRelatedOnlyFieldListFilter),
+        ("primary_provider", CachedRelatedOnlyFieldListFilter),
+        "status", "appointment_type", "priority",
+    )
     search_fields = ("patient__first_name", "patient__last_name", "primary_provider__username", "reason", "appointment_number")
-    autocomplete_fields = ("patient", "primary_provider", "hospital", "template")
+    list_select_related = ("patient", "primary_provider", "hospital")
+    autocomplete_fields = ("patient", "primary_provider", "additional_providers", "hospital", "template")
     readonly_fields = ("uuid", "appointment_number", "created_at", "updated_at")
-    filter_horizontal = ("additional_providers",)
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
     
+    def get_queryset(self, request):
+        # The change form and any M2M traversal otherwise re-query
+        # additional_providers per appointment; two round-trips total
+        # regardless of page size with the prefetch.
+        return super().get_queryset(request).prefetch_related('additional_providers')
+
+    def get_changelist(self, request, **kwargs):
+        return AppointmentChangeList
+
     fieldsets = (
         ('Basic Information', {
             'fields': ('uuid', 'appointment_number', 'patient', 'primary_provider', 'additional_providers')
@@ -42,6 +84,7 @@ class AppointmentTemplateAdmin(admin.ModelAdmin):
     list_display = ('name', 'appointment_type', 'duration_minutes', 'hospital', 'is_active')
     list_filter = ('hospital', 'appointment_type', 'is_active', 'allows_online_booking')
     search_fields = ('name', 'description', 'specialty_required')
+    list_select_related = ('hospital',)
     autocomplete_fields = ('hospital',)
     
 
@@ -50,34 +93,56 @@ class ResourceAdmin(admin.ModelAdmin):
     list_display = ('name', 'resource_type', 'hospital', 'capacity', 'is_active', 'is_bookable')
     list_filter = ('hospital', 'resource_type', 'is_active', 'is_bookable')
     search_fields = ('name', 'description', 'location')
+    list_select_related = ('hospital',)
     autocomplete_fields = ('hospital',)
 
 
 @admin.register(WaitList)
 class WaitListAdmin(admin.ModelAdmin):
     list_display = ('patient', 'provider', 'appointment_type', 'priority', 'is_active', 'created_at')
-    list_filter = ('hospital', 'provider', 'appointment_type', 'priority', 'is_active')
+    list_filter = (
+        ('hospital', CachedRelatedOnlyFieldListFilter),
+        ('provider', CachedRelatedOnlyFieldListFilter),
+        'appointment_type', 'priority', 'is_active',
+    )
     search_fields = ('patient__first_name', 'patient__last_name', 'reason')
+    list_select_related = ('patient', 'provider')
     autocomplete_fields = ('patient', 'provider', 'hospital', 'created_by')
     readonly_fields = ('notified_count', 'last_notification', 'created_at', 'updated_at')
 
 
 @admin.register(AppointmentReminder)
 class AppointmentReminderAdmin(admin.ModelAdmin):
-    list_display = ('appointment', 'reminder_type', 'scheduled_for', 'status', 'sent_at')
-    list_filter = ('reminder_type', 'status', 'scheduled_for')
+    list_display = ('appointment_label', 'reminder_type', 'scheduled_for', 'status', 'sent_at')
+    list_filter = ('reminder_type', 'status')
+    date_hierarchy = 'scheduled_for'
     search_fields = ('appointment__patient__first_name', 'appointment__patient__last_name', 'subject')
     autocomplete_fields = ('appointment',)
     readonly_fields = ('sent_at', 'delivered_at', 'created_at', 'updated_at')
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
 
 
 @admin.register(AppointmentHistory)
 class AppointmentHistoryAdmin(admin.ModelAdmin):
-    list_display = ('appointment', 'action', 'changed_by', 'timestamp')
-    list_filter = ('action', 'timestamp', 'changed_by')
+    list_display = ('appointment_label', 'action', 'changed_by', 'timestamp')
+    list_filter = ('action', ('changed_by', CachedRelatedFieldListFilter))
+    date_hierarchy = 'timestamp'
     search_fields = ('appointment__patient__first_name', 'appointment__patient__last_name', 'notes')
+    list_select_related = ('changed_by',)
     autocomplete_fields = ('appointment', 'changed_by')
     readonly_fields = ('timestamp',)
+    # Matches the covering index so the changelist never sorts; skipping
+    # the full COUNT(*) matters once the audit log reaches millions of rows.
+    ordering = ('-timestamp',)
+    show_full_result_count = False
+    paginator = EstimatedCountPaginator
+    # Read-only log: no bulk actions, no per-row edit links, and sorting
+    # restricted to the indexed timestamp column.
+    actions = None
+    list_display_links = None
+    list_max_show_all = 200
+    sortable_by = ('timestamp',)
     
     def has_add_permission(self, request):
         return False  # History entries should only be created programmatically
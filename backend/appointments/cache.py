@@ -0,0 +1,39 @@
+"""
+Cache helpers for read-mostly appointment reference data.
+"""
+
+from django.core.cache import cache
+
+REFDATA_TTL_SECONDS = 300
+
+
+def _version_key(model):
+    return f'appointments:refdata:{model._meta.model_name}:version'
+
+
+def refdata_version(model):
+    version = cache.get(_version_key(model))
+    if version is None:
+        cache.add(_version_key(model), 1, None)
+        version = cache.get(_version_key(model)) or 1
+    return version
+
+
+def refdata_list_key(model, scope, params=''):
+    """Cache key for one tenant's view of a reference-data list.
+
+    The version segment makes invalidation O(1): writes bump the
+    version and every cached page for the model goes stale at once,
+    whatever filter parameters it was built with.
+    """
+    return (
+        f'appointments:refdata:{model._meta.model_name}:'
+        f'v{refdata_version(model)}:{scope}:{params}'
+    )
+
+
+def invalidate_refdata(model):
+    try:
+        cache.incr(_version_key(model))
+    except ValueError:
+        cache.set(_version_key(model), 1, None)
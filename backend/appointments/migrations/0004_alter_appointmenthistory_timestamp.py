@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0003_alter_appointment_appointment_number'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='appointmenthistory',
+            name='timestamp',
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
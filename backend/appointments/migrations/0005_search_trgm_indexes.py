@@ -0,0 +1,40 @@
+from django.db import migrations
+
+# Columns the appointment admin's search_fields hit with ILIKE '%term%'.
+_TRGM_INDEXES = [
+    ('appt_search_patient_fname_trgm', 'patients_patient', 'first_name'),
+    ('appt_search_patient_lname_trgm', 'patients_patient', 'last_name'),
+    ('appt_search_provider_uname_trgm', 'users_user', 'username'),
+    ('appt_search_reason_trgm', 'appointments_appointment', 'reason'),
+]
+
+
+def add_trgm_indexes(apps, schema_editor):
+    # pg_trgm GIN indexes make unanchored ILIKE patterns index-eligible;
+    # PostgreSQL-only, so the sqlite test database skips them.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in _TRGM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS {name} ON {table} '
+            f'USING gin ({column} gin_trgm_ops)'
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, _table, _column in _TRGM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0004_alter_appointmenthistory_timestamp'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_trgm_indexes, drop_trgm_indexes),
+    ]
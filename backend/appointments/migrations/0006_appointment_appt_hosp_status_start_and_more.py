@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0005_search_trgm_indexes'),
+        ('hospitals', '0002_plan_hospitalplan'),
+        ('patients', '0004_alter_patient_medical_record_number'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['hospital', 'status', '-start_at'], name='appt_hosp_status_start'),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['primary_provider', '-start_at'], name='appointment_primary_b3bc77_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appointmentreminder',
+            index=models.Index(fields=['status', 'scheduled_for'], name='appointment_status_3e65f8_idx'),
+        ),
+    ]
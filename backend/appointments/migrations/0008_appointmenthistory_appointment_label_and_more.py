@@ -0,0 +1,23 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:50
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0007_appt_history_covering_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appointmenthistory',
+            name='appointment_label',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+        migrations.AddField(
+            model_name='appointmentreminder',
+            name='appointment_label',
+            field=models.CharField(blank=True, default='', max_length=255),
+        ),
+    ]
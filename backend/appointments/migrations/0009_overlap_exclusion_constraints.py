@@ -0,0 +1,57 @@
+from django.db import migrations
+
+_ACTIVE_STATUSES = "('SCHEDULED', 'CONFIRMED', 'CHECKED_IN', 'IN_PROGRESS')"
+
+
+def add_exclusion_constraints(apps, schema_editor):
+    # GiST exclusion constraints make overlap detection a DB-level
+    # invariant: no per-save SELECT, and concurrent inserts cannot race
+    # past each other. PostgreSQL-only (btree_gist for the equality
+    # columns); the sqlite test database skips them.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS btree_gist')
+    schema_editor.execute(
+        'ALTER TABLE appointments_appointment '
+        'DROP CONSTRAINT IF EXISTS appt_no_overlap'
+    )
+    schema_editor.execute(
+        'ALTER TABLE appointments_appointment '
+        'ADD CONSTRAINT appt_no_overlap EXCLUDE USING gist ('
+        'hospital_id WITH =, primary_provider_id WITH =, '
+        'tstzrange(start_at, end_at) WITH &&) '
+        f'WHERE (status IN {_ACTIVE_STATUSES})'
+    )
+    schema_editor.execute(
+        'ALTER TABLE appointments_appointmentresource '
+        'DROP CONSTRAINT IF EXISTS appt_resource_no_overlap'
+    )
+    schema_editor.execute(
+        'ALTER TABLE appointments_appointmentresource '
+        'ADD CONSTRAINT appt_resource_no_overlap EXCLUDE USING gist ('
+        'resource_id WITH =, tstzrange(start_time, end_time) WITH &&)'
+    )
+
+
+def drop_exclusion_constraints(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'ALTER TABLE appointments_appointment '
+        'DROP CONSTRAINT IF EXISTS appt_no_overlap'
+    )
+    schema_editor.execute(
+        'ALTER TABLE appointments_appointmentresource '
+        'DROP CONSTRAINT IF EXISTS appt_resource_no_overlap'
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0008_appointmenthistory_appointment_label_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_exclusion_constraints, drop_exclusion_constraints),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:55
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0009_overlap_exclusion_constraints'),
+        ('hospitals', '0002_plan_hospitalplan'),
+        ('patients', '0004_alter_patient_medical_record_number'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(condition=models.Q(('status__in', ['SCHEDULED', 'CONFIRMED', 'CHECKED_IN', 'IN_PROGRESS'])), fields=['hospital', 'primary_provider', 'start_at', 'end_at'], name='appt_overlap_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(condition=models.Q(('status', 'SCHEDULED')), fields=['hospital', 'start_at'], name='appt_upcoming_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='appointmentreminder',
+            index=models.Index(condition=models.Q(('status', 'PENDING')), fields=['scheduled_for'], name='reminder_pending_idx'),
+        ),
+    ]
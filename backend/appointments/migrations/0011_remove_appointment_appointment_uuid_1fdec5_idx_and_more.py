@@ -0,0 +1,21 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:56
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0010_appointment_appt_overlap_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='appointment',
+            name='appointment_uuid_1fdec5_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='appointment',
+            name='appointment_appoint_93abbc_idx',
+        ),
+    ]
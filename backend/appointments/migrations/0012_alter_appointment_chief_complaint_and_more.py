@@ -0,0 +1,24 @@
+# Generated by Django 5.2.17 on 2026-08-29 14:58
+
+import core.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0011_remove_appointment_appointment_uuid_1fdec5_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='appointment',
+            name='chief_complaint',
+            field=core.fields.AesGcmTextField(blank=True),
+        ),
+        migrations.AlterField(
+            model_name='appointment',
+            name='clinical_notes',
+            field=core.fields.AesGcmTextField(blank=True),
+        ),
+    ]
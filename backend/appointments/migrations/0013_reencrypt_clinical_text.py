@@ -0,0 +1,33 @@
+from django.db import migrations
+
+
+def reencrypt(apps, schema_editor):
+    # Reading through AesGcmTextField transparently decrypts legacy
+    # Fernet tokens; writing back re-seals with AES-GCM. Batched so a
+    # large table never materializes in memory.
+    Appointment = apps.get_model('appointments', 'Appointment')
+    queryset = Appointment.objects.exclude(
+        chief_complaint='', clinical_notes=''
+    ).only('id', 'chief_complaint', 'clinical_notes')
+    batch = []
+    for appointment in queryset.iterator(chunk_size=2000):
+        batch.append(appointment)
+        if len(batch) >= 500:
+            Appointment.objects.bulk_update(
+                batch, ['chief_complaint', 'clinical_notes'])
+            batch = []
+    if batch:
+        Appointment.objects.bulk_update(
+            batch, ['chief_complaint', 'clinical_notes'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0012_alter_appointment_chief_complaint_and_more'),
+    ]
+
+    operations = [
+        # Reverse is a no-op: the field reads both formats.
+        migrations.RunPython(reencrypt, migrations.RunPython.noop),
+    ]
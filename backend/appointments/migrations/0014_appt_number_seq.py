@@ -0,0 +1,28 @@
+from django.db import migrations
+
+
+def create_sequence(apps, schema_editor):
+    # Backing sequence for appointment numbers; CACHE 50 keeps the
+    # nextval cost off the hot path. PostgreSQL-only — other backends
+    # use the timestamp fallback in reserve_appointment_numbers.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE SEQUENCE IF NOT EXISTS appt_number_seq CACHE 50')
+
+
+def drop_sequence(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('DROP SEQUENCE IF EXISTS appt_number_seq')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0013_reencrypt_clinical_text'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_sequence, drop_sequence),
+    ]
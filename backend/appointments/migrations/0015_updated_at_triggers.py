@@ -0,0 +1,52 @@
+from django.db import migrations
+
+_TABLES = [
+    'appointments_appointmenttemplate',
+    'appointments_resource',
+    'appointments_appointment',
+    'appointments_waitlist',
+    'appointments_appointmentreminder',
+]
+
+
+def add_triggers(apps, schema_editor):
+    # BEFORE UPDATE triggers stamp updated_at in the database, so
+    # queryset .update() and bulk_update paths — which skip Django's
+    # auto_now handling entirely — bump it too. PostgreSQL-only; other
+    # backends rely on auto_now alone.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE OR REPLACE FUNCTION appointments_set_updated_at() '
+        'RETURNS trigger AS $$ '
+        'BEGIN NEW.updated_at = now(); RETURN NEW; END; '
+        '$$ LANGUAGE plpgsql'
+    )
+    for table in _TABLES:
+        schema_editor.execute(
+            f'DROP TRIGGER IF EXISTS set_updated_at ON {table}')
+        schema_editor.execute(
+            f'CREATE TRIGGER set_updated_at BEFORE UPDATE ON {table} '
+            'FOR EACH ROW EXECUTE FUNCTION appointments_set_updated_at()'
+        )
+
+
+def drop_triggers(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for table in _TABLES:
+        schema_editor.execute(
+            f'DROP TRIGGER IF EXISTS set_updated_at ON {table}')
+    schema_editor.execute(
+        'DROP FUNCTION IF EXISTS appointments_set_updated_at()')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0014_appt_number_seq'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_triggers, drop_triggers),
+    ]
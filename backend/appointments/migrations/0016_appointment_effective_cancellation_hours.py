@@ -0,0 +1,18 @@
+# Generated by Django 5.2.17 on 2026-08-29 15:04
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0015_updated_at_triggers'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='appointment',
+            name='effective_cancellation_hours',
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,24 @@
+from django.db import migrations
+from django.db.models import OuterRef, Subquery
+
+
+def backfill(apps, schema_editor):
+    # One UPDATE with a correlated subquery; no per-row iteration.
+    Appointment = apps.get_model('appointments', 'Appointment')
+    AppointmentTemplate = apps.get_model('appointments', 'AppointmentTemplate')
+    template_hours = AppointmentTemplate.objects.filter(
+        pk=OuterRef('template_id')).values('cancellation_hours')[:1]
+    Appointment.objects.filter(
+        effective_cancellation_hours__isnull=True, template__isnull=False,
+    ).update(effective_cancellation_hours=Subquery(template_hours))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0016_appointment_effective_cancellation_hours'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
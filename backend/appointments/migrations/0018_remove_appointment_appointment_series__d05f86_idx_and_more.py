@@ -0,0 +1,30 @@
+# Generated by Django 5.2.17 on 2026-08-29 15:07
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0017_backfill_cancellation_hours'),
+        ('hospitals', '0002_plan_hospitalplan'),
+        ('patients', '0004_alter_patient_medical_record_number'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='appointment',
+            name='appointment_series__d05f86_idx',
+        ),
+        migrations.AlterField(
+            model_name='appointment',
+            name='series_id',
+            field=models.UUIDField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['series_id', 'start_at'], name='appt_series_window_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.17 on 2026-08-29 15:10
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0018_remove_appointment_appointment_series__d05f86_idx_and_more'),
+        ('hospitals', '0002_plan_hospitalplan'),
+        ('patients', '0004_alter_patient_medical_record_number'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='appointment',
+            constraint=models.CheckConstraint(condition=models.Q(('end_at__gt', models.F('start_at'))), name='appt_end_after_start'),
+        ),
+        migrations.AddConstraint(
+            model_name='appointmentresource',
+            constraint=models.CheckConstraint(condition=models.Q(('end_time__gt', models.F('start_time'))), name='appt_resource_end_after_start'),
+        ),
+    ]
@@ -0,0 +1,45 @@
+from django.db import migrations
+
+
+def add_trigger(apps, schema_editor):
+    # Recompute duration_minutes from the timestamps on every write so
+    # .update() and bulk paths — which skip save()'s recomputation —
+    # can't desync it. PostgreSQL-only; other backends rely on save().
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE OR REPLACE FUNCTION appointments_set_duration() '
+        'RETURNS trigger AS $$ '
+        'BEGIN NEW.duration_minutes = '
+        'EXTRACT(EPOCH FROM (NEW.end_at - NEW.start_at))::integer / 60; '
+        'RETURN NEW; END; '
+        '$$ LANGUAGE plpgsql'
+    )
+    schema_editor.execute(
+        'DROP TRIGGER IF EXISTS set_duration ON appointments_appointment')
+    schema_editor.execute(
+        'CREATE TRIGGER set_duration '
+        'BEFORE INSERT OR UPDATE OF start_at, end_at '
+        'ON appointments_appointment '
+        'FOR EACH ROW EXECUTE FUNCTION appointments_set_duration()'
+    )
+
+
+def drop_trigger(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'DROP TRIGGER IF EXISTS set_duration ON appointments_appointment')
+    schema_editor.execute(
+        'DROP FUNCTION IF EXISTS appointments_set_duration()')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0019_appointment_appt_end_after_start_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_trigger, drop_trigger),
+    ]
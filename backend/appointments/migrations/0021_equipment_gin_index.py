@@ -0,0 +1,32 @@
+from django.db import migrations
+
+
+def add_gin_index(apps, schema_editor):
+    # jsonb_path_ops GIN index makes equipment containment lookups
+    # (equipment_required__contains=[...]) index-eligible instead of a
+    # per-row jsonb decode. PostgreSQL-only; sqlite skips it.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS appt_template_equipment_gin '
+        'ON appointments_appointmenttemplate '
+        'USING gin (equipment_required jsonb_path_ops)'
+    )
+
+
+def drop_gin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'DROP INDEX IF EXISTS appt_template_equipment_gin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0020_duration_minutes_trigger'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_gin_index, drop_gin_index),
+    ]
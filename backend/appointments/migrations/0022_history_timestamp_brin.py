@@ -0,0 +1,32 @@
+from django.db import migrations
+
+
+def add_brin_index(apps, schema_editor):
+    # History is append-only and timestamp-correlated with insertion
+    # order, the ideal BRIN shape: ~a hundred bytes of index per 1MB of
+    # heap for archival date-range scans. PostgreSQL-only.
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'CREATE INDEX IF NOT EXISTS appt_history_timestamp_brin '
+        'ON appointments_appointmenthistory '
+        'USING BRIN (timestamp) WITH (pages_per_range = 32)'
+    )
+
+
+def drop_brin_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute(
+        'DROP INDEX IF EXISTS appt_history_timestamp_brin')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0021_equipment_gin_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_brin_index, drop_brin_index),
+    ]
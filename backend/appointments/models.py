@@ -1,9 +1,11 @@
-from django.db import models
+from django.db import connection, models
+from django.db.models import functions
 from django.core.exceptions import ValidationError
 from django.utils import timezone
 from django.core.validators import MinValueValidator, MaxValueValidator
 from core.models import TenantModel
-from encrypted_model_fields.fields import EncryptedTextField
+from core.fields import AesGcmTextField
+import time
 import uuid
 from datetime import timedelta, datetime
 import json
@@ -21,6 +23,35 @@ class AppointmentStatus(models.TextChoices):
     ON_HOLD = 'ON_HOLD', 'On Hold'
 
 
+# Lazily cached local timezone for __str__; timezone.localtime re-resolves
+# settings.TIME_ZONE and rebuilds the tzinfo on every call, which adds up
+# when rendering long appointment lists. Lazy so settings are loaded and
+# activate()-based overrides at import time are respected.
+_LOCAL_TZ = None
+
+
+def _local_tz():
+    global _LOCAL_TZ
+    if _LOCAL_TZ is None:
+        _LOCAL_TZ = timezone.get_current_timezone()
+    return _LOCAL_TZ
+
+
+# Shared status sets: built once instead of as fresh list literals at
+# every call site that filters on "active" or "finished" appointments.
+ACTIVE_APPOINTMENT_STATUSES = (
+    AppointmentStatus.SCHEDULED,
+    AppointmentStatus.CONFIRMED,
+    AppointmentStatus.CHECKED_IN,
+    AppointmentStatus.IN_PROGRESS,
+)
+TERMINAL_APPOINTMENT_STATUSES = (
+    AppointmentStatus.COMPLETED,
+    AppointmentStatus.CANCELLED,
+    AppointmentStatus.NO_SHOW,
+)
+
+
 class AppointmentType(models.TextChoices):
     ROUTINE = 'ROUTINE', 'Routine Visit'
     FOLLOW_UP = 'FOLLOW_UP', 'Follow-up'
@@ -140,6 +171,29 @@ class Resource(TenantModel):
         return f"{self.name} ({self.resource_type})"
 
 
+class AppointmentQuerySet(models.QuerySet):
+    """Queryset helpers for the appointment list/detail endpoints."""
+
+    def with_related(self):
+        """Bake in the canonical related-object loading.
+
+        select_related for the FK rows the serializers always render,
+        prefetch_related for the to-many sets; iterating the result
+        costs a fixed handful of queries instead of several per row.
+        """
+        return self.select_related(
+            'patient', 'primary_provider', 'template', 'hospital', 'scheduled_by'
+        ).prefetch_related(
+            'additional_providers',
+            'appointmentresource_set__resource',
+            'reminders',
+            models.Prefetch(
+                'history',
+                queryset=AppointmentHistory.objects.select_related('changed_by'),
+            ),
+        )
+
+
 class Appointment(TenantModel):
     """Enhanced appointment model with enterprise features"""
     uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
@@ -153,10 +207,16 @@ class Appointment(TenantModel):
     # Appointment Details
     appointment_type = models.CharField(max_length=20, choices=AppointmentType.choices, default=AppointmentType.ROUTINE)
     template = models.ForeignKey(AppointmentTemplate, on_delete=models.SET_NULL, null=True, blank=True)
+    # Copied from the template at creation so can_be_cancelled never
+    # needs the template row (a lazy FK fetch per appointment in lists).
+    effective_cancellation_hours = models.PositiveIntegerField(null=True, blank=True)
     
     # Timing
     start_at = models.DateTimeField()
     end_at = models.DateTimeField()
+    # On PostgreSQL a trigger (migration 0020) recomputes this from the
+    # timestamps on every write, so .update()/bulk paths that skip
+    # save() can't desync it; save() keeps the portable fallback.
     duration_minutes = models.PositiveIntegerField(default=30)
     
     # Status & Priority
@@ -165,15 +225,19 @@ class Appointment(TenantModel):
     
     # Clinical Information
     reason = models.CharField(max_length=255, blank=True)
-    chief_complaint = EncryptedTextField(blank=True)
-    clinical_notes = EncryptedTextField(blank=True)
+    chief_complaint = AesGcmTextField(blank=True)
+    clinical_notes = AesGcmTextField(blank=True)
     
     # Scheduling Information
+    # The four audit FKs below are written on transitions but never
+    # filtered on, so their default B-tree indexes were pure write
+    # amplification; db_index=False drops them.
     scheduled_by = models.ForeignKey(
         'users.User',
         on_delete=models.SET_NULL,
         null=True,
         blank=True,
+        db_index=False,
         related_name='scheduled_appointments'
     )
     confirmation_required = models.BooleanField(default=False)
@@ -183,6 +247,7 @@ class Appointment(TenantModel):
         on_delete=models.SET_NULL,
         null=True,
         blank=True,
+        db_index=False,
         related_name='confirmed_appointments'
     )
     
@@ -193,6 +258,7 @@ class Appointment(TenantModel):
         on_delete=models.SET_NULL,
         null=True,
         blank=True,
+        db_index=False,
         related_name='checked_in_appointments'
     )
     
@@ -222,7 +288,7 @@ class Appointment(TenantModel):
     recurrence_pattern = models.CharField(max_length=15, choices=RecurrencePattern.choices, default=RecurrencePattern.NONE)
     recurrence_end_date = models.DateField(null=True, blank=True)
     parent_appointment = models.ForeignKey('self', on_delete=models.CASCADE, null=True, blank=True, related_name='recurring_appointments')
-    series_id = models.UUIDField(null=True, blank=True, db_index=True)
+    series_id = models.UUIDField(null=True, blank=True)
     
     # Cancellation Information
     cancelled_at = models.DateTimeField(null=True, blank=True)
@@ -231,6 +297,7 @@ class Appointment(TenantModel):
         on_delete=models.SET_NULL,
         null=True,
         blank=True,
+        db_index=False,
         related_name='cancelled_appointments'
     )
     cancellation_reason = models.CharField(max_length=200, blank=True)
@@ -249,43 +316,150 @@ class Appointment(TenantModel):
     requires_interpretation = models.BooleanField(default=False)
     interpreter_language = models.CharField(max_length=50, blank=True)
     requires_transportation = models.BooleanField(default=False)
-    
+
+    objects = AppointmentQuerySet.as_manager()
+
     class Meta:
         indexes = [
             models.Index(fields=['hospital', 'primary_provider', 'start_at']),
             models.Index(fields=['hospital', 'patient', 'start_at']),
             models.Index(fields=['status', 'start_at']),
+            # Changelist shape: filter by hospital/status, order by start_at
+            models.Index(fields=['hospital', 'status', '-start_at'], name='appt_hosp_status_start'),
+            models.Index(fields=['primary_provider', '-start_at']),
             models.Index(fields=['appointment_type', 'start_at']),
-            models.Index(fields=['series_id']),
-            models.Index(fields=['uuid']),
-            models.Index(fields=['appointment_number']),
+            # Active rows only: availability and overlap lookups filter
+            # these statuses, so dead (cancelled/completed) rows stay out
+            # of the scan set.
+            models.Index(
+                fields=['hospital', 'primary_provider', 'start_at', 'end_at'],
+                name='appt_overlap_idx',
+                condition=models.Q(status__in=ACTIVE_APPOINTMENT_STATUSES),
+            ),
+            models.Index(
+                fields=['hospital', 'start_at'],
+                name='appt_upcoming_idx',
+                condition=models.Q(status='SCHEDULED'),
+            ),
+            # Series lookups are windowed ("siblings in a date range"),
+            # so start_at rides along as a second key column.
+            models.Index(fields=['series_id', 'start_at'], name='appt_series_window_idx'),
+        ]
+        constraints = [
+            # DB-enforced so bulk_create paths that skip clean() can't
+            # insert inverted intervals.
+            models.CheckConstraint(
+                check=models.Q(end_at__gt=models.F('start_at')),
+                name='appt_end_after_start',
+            ),
         ]
         ordering = ['start_at']
 
     def clean(self):
         if self.end_at <= self.start_at:
             raise ValidationError('end_at must be after start_at')
-        
-        # Check for overlapping appointments for the same provider
-        if self.status not in [AppointmentStatus.CANCELLED, AppointmentStatus.NO_SHOW]:
-            overlapping = Appointment.objects.filter(
-                hospital=self.hospital,
-                primary_provider=self.primary_provider,
-                status__in=[AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED, 
-                           AppointmentStatus.CHECKED_IN, AppointmentStatus.IN_PROGRESS]
-            ).exclude(pk=self.pk)
-            overlapping = overlapping.filter(start_at__lt=self.end_at, end_at__gt=self.start_at)
-            
-            if overlapping.exists():
-                raise ValidationError('Overlapping appointment for this provider')
+        # Provider overlap is enforced by the appt_no_overlap exclusion
+        # constraint (migration 0009): a SELECT here would cost a query
+        # per save and still race with concurrent inserts.
+
+    @classmethod
+    def reserve_appointment_numbers(cls, count):
+        """Return `count` unique appointment numbers.
+
+        On PostgreSQL numbers come from appt_number_seq (migration
+        0014) — lock-free, collision-free under concurrency, and one
+        round-trip for a whole batch. Other backends fall back to a
+        timestamp-plus-sequence scheme that is only unique per process.
+        """
+        if count <= 0:
+            return []
+        if connection.vendor == 'postgresql':
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT nextval('appt_number_seq') "
+                    "FROM generate_series(1, %s)", [count])
+                return [f"APT{row[0]:08d}" for row in cursor.fetchall()]
+        timestamp = str(int(time.time()))
+        if count == 1:
+            return [f"APT{timestamp[-8:]}"]
+        return [f"APT{timestamp[-8:]}-{i:04d}" for i in range(count)]
+
+    @classmethod
+    def generate_appointment_number(cls):
+        """Build a single appointment number."""
+        return cls.reserve_appointment_numbers(1)[0]
+
+    @classmethod
+    def create_series(cls, parent, pattern, end_date):
+        """Materialize a recurring series as bulk-inserted children.
+
+        Occurrences are computed in memory and written with bulk_create,
+        so N children cost ceil(N/500) round-trips instead of N
+        individual saves; the appt_no_overlap exclusion constraint still
+        vets every inserted row.
+        """
+        step = {
+            RecurrencePattern.DAILY: timedelta(days=1),
+            RecurrencePattern.WEEKLY: timedelta(weeks=1),
+            RecurrencePattern.BIWEEKLY: timedelta(weeks=2),
+            RecurrencePattern.MONTHLY: timedelta(days=30),
+            RecurrencePattern.QUARTERLY: timedelta(days=91),
+            RecurrencePattern.ANNUALLY: timedelta(days=365),
+        }.get(pattern)
+        if step is None:
+            raise ValueError(f'Unsupported recurrence pattern: {pattern}')
+
+        if not parent.series_id:
+            parent.is_recurring = True
+            parent.recurrence_pattern = pattern
+            parent.recurrence_end_date = end_date
+            parent.series_id = uuid.uuid4()
+            parent.save(update_fields=[
+                'is_recurring', 'recurrence_pattern', 'recurrence_end_date',
+                'series_id', 'updated_at',
+            ])
+
+        duration = parent.end_at - parent.start_at
+        starts = []
+        start = parent.start_at + step
+        while start.date() <= end_date:
+            starts.append(start)
+            start += step
+        numbers = cls.reserve_appointment_numbers(len(starts))
+
+        occurrences = []
+        for start, number in zip(starts, numbers):
+            occurrences.append(cls(
+                hospital_id=parent.hospital_id,
+                appointment_number=number,
+                patient_id=parent.patient_id,
+                primary_provider_id=parent.primary_provider_id,
+                appointment_type=parent.appointment_type,
+                template_id=parent.template_id,
+                effective_cancellation_hours=parent.effective_cancellation_hours,
+                start_at=start,
+                end_at=start + duration,
+                duration_minutes=int(duration.total_seconds() // 60),
+                priority=parent.priority,
+                reason=parent.reason,
+                scheduled_by_id=parent.scheduled_by_id,
+                location=parent.location,
+                room=parent.room,
+                is_telehealth=parent.is_telehealth,
+                is_recurring=True,
+                recurrence_pattern=pattern,
+                recurrence_end_date=end_date,
+                parent_appointment=parent,
+                series_id=parent.series_id,
+            ))
+        return cls.objects.bulk_create(occurrences, batch_size=500)
 
     def save(self, *args, **kwargs):
-        # Generate appointment number if not provided
-        if not self.appointment_number:
-            import time
-            timestamp = str(int(time.time()))
-            self.appointment_number = f"APT{timestamp[-8:]}"
-        
+        # Generate appointment number if not provided ('TEMP' is the
+        # field default, not a real number)
+        if not self.appointment_number or self.appointment_number == 'TEMP':
+            self.appointment_number = self.generate_appointment_number()
+
         # Set duration based on start/end times
         if self.start_at and self.end_at:
             duration = (self.end_at - self.start_at).total_seconds() / 60
@@ -294,11 +468,15 @@ class Appointment(TenantModel):
         # Generate series ID for recurring appointments
         if self.is_recurring and not self.series_id:
             self.series_id = uuid.uuid4()
-        
+
+        # Snapshot the template's cancellation window
+        if self.effective_cancellation_hours is None and self.template_id:
+            self.effective_cancellation_hours = self.template.cancellation_hours
+
         super().save(*args, **kwargs)
 
     def __str__(self) -> str:
-        return f"{self.patient} with {self.primary_provider} at {timezone.localtime(self.start_at)}"
+        return f"{self.patient} with {self.primary_provider} at {self.start_at.astimezone(_local_tz())}"
     
     def get_duration_display(self):
         """Return human-readable duration"""
@@ -310,30 +488,44 @@ class Appointment(TenantModel):
     
     def can_be_cancelled(self):
         """Check if appointment can be cancelled based on timing and status"""
-        if self.status in [AppointmentStatus.COMPLETED, AppointmentStatus.CANCELLED, AppointmentStatus.NO_SHOW]:
+        if self.status in TERMINAL_APPOINTMENT_STATUSES:
             return False
         
         # Check if within cancellation window
-        if self.template and self.template.cancellation_hours:
-            cutoff = self.start_at - timedelta(hours=self.template.cancellation_hours)
+        if self.effective_cancellation_hours:
+            cutoff = self.start_at - timedelta(hours=self.effective_cancellation_hours)
             return timezone.now() < cutoff
-        
+
         return True
     
     def mark_as_no_show(self, user=None):
         """Mark appointment as no-show"""
-        self.status = AppointmentStatus.NO_SHOW
-        self.no_show_at = timezone.now()
+        updates = {'status': AppointmentStatus.NO_SHOW, 'no_show_at': functions.Now()}
         if user:
-            self.cancelled_by = user
-        self.save()
-    
+            updates['cancelled_by'] = user
+        updated = type(self).objects.filter(pk=self.pk).exclude(
+            status__in=TERMINAL_APPOINTMENT_STATUSES,
+        ).update(**updates)
+        if not updated:
+            raise ValidationError('Appointment is already in a terminal state')
+        self.refresh_from_db(fields=['status', 'no_show_at', 'cancelled_by'])
+
     def check_in(self, user):
         """Check in the patient for the appointment"""
-        self.status = AppointmentStatus.CHECKED_IN
-        self.checked_in_at = timezone.now()
-        self.checked_in_by = user
-        self.save()
+        # One guarded UPDATE: the status__in predicate makes concurrent
+        # double check-ins lose the race at the DB instead of needing
+        # SELECT FOR UPDATE, and only three columns are written.
+        updated = type(self).objects.filter(
+            pk=self.pk,
+            status__in=[AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED],
+        ).update(
+            status=AppointmentStatus.CHECKED_IN,
+            checked_in_at=functions.Now(),
+            checked_in_by=user,
+        )
+        if not updated:
+            raise ValidationError('Appointment cannot be checked in from its current state')
+        self.refresh_from_db(fields=['status', 'checked_in_at', 'checked_in_by'])
     
     # Backward compatibility properties
     @property
@@ -371,17 +563,18 @@ class AppointmentResource(models.Model):
         indexes = [
             models.Index(fields=['resource', 'start_time']),
         ]
+        constraints = [
+            models.CheckConstraint(
+                check=models.Q(end_time__gt=models.F('start_time')),
+                name='appt_resource_end_after_start',
+            ),
+        ]
     
     def clean(self):
-        # Check resource availability
-        overlapping = AppointmentResource.objects.filter(
-            resource=self.resource,
-            start_time__lt=self.end_time,
-            end_time__gt=self.start_time
-        ).exclude(pk=self.pk)
-        
-        if overlapping.exists():
-            raise ValidationError(f'Resource {self.resource.name} is not available during this time')
+        if self.end_time <= self.start_time:
+            raise ValidationError('end_time must be after start_time')
+        # Double-booking of a resource is enforced by the
+        # appt_resource_no_overlap exclusion constraint (migration 0009).
 
 
 class WaitList(TenantModel):
@@ -423,6 +616,9 @@ class WaitList(TenantModel):
 class AppointmentReminder(models.Model):
     """Automated appointment reminders"""
     appointment = models.ForeignKey(Appointment, on_delete=models.CASCADE, related_name='reminders')
+    # Denormalized str(appointment); lets list views render the parent
+    # without joining patient and provider. Kept current by signals.
+    appointment_label = models.CharField(max_length=255, blank=True, default='')
     
     reminder_type = models.CharField(
         max_length=15,
@@ -478,6 +674,15 @@ class AppointmentReminder(models.Model):
         indexes = [
             models.Index(fields=['appointment', 'status']),
             models.Index(fields=['scheduled_for', 'status']),
+            # Reminder worker scan: status equality, scheduled_for range
+            models.Index(fields=['status', 'scheduled_for']),
+            # Dense variant for the worker's PENDING-only poll; sent
+            # rows vastly outnumber pending ones over time.
+            models.Index(
+                fields=['scheduled_for'],
+                name='reminder_pending_idx',
+                condition=models.Q(status='PENDING'),
+            ),
         ]
     
     def __str__(self):
@@ -487,6 +692,8 @@ class AppointmentReminder(models.Model):
 class AppointmentHistory(models.Model):
     """Track appointment changes and history"""
     appointment = models.ForeignKey(Appointment, on_delete=models.CASCADE, related_name='history')
+    # Denormalized str(appointment); see AppointmentReminder.
+    appointment_label = models.CharField(max_length=255, blank=True, default='')
     
     action = models.CharField(
         max_length=15,
@@ -511,7 +718,7 @@ class AppointmentHistory(models.Model):
     
     # Actor information
     changed_by = models.ForeignKey('users.User', on_delete=models.SET_NULL, null=True)
-    timestamp = models.DateTimeField(auto_now_add=True)
+    timestamp = models.DateTimeField(auto_now_add=True, db_index=True)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     
     class Meta:
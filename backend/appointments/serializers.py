@@ -1,10 +1,298 @@
 from rest_framework import serializers
-from django.core.exceptions import ValidationError as DjangoValidationError
+from rest_framework.relations import PKOnlyObject
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db import IntegrityError
+from django.db.models import Case, CharField, F, Q, Value, When
+from django.db.models.constants import LOOKUP_SEP
+from django.db.models.functions import Concat, LTrim
 from .models import (
-    Appointment, AppointmentTemplate, Resource, AppointmentResource, 
+    Appointment, AppointmentTemplate, Resource, AppointmentResource,
     WaitList, AppointmentReminder, AppointmentHistory, AppointmentStatus
 )
 
+_EAGER_LOADING_CACHE = {}
+
+
+def _get_model_field(model, name):
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        # Reverse FK accessors like appointmentresource_set.
+        if name.endswith('_set'):
+            try:
+                return model._meta.get_field(name[:-4])
+            except FieldDoesNotExist:
+                pass
+        return None
+
+
+def _resolve_source(model, source):
+    """Resolve a dotted serializer source against the model.
+
+    Returns (kind, path, tail_model): kind is 'select' while the chain
+    is FK/one-to-one, 'prefetch' once it crosses a to-many hop, or None
+    when the source never touches a relation (plain columns, methods).
+    """
+    kind = 'select'
+    path = []
+    current = model
+    for segment in source.split('.'):
+        field = _get_model_field(current, segment)
+        if field is None or not field.is_relation:
+            break
+        if not (field.many_to_one or field.one_to_one):
+            kind = 'prefetch'
+        # Keep the accessor spelling: prefetch_related traverses by
+        # attribute name, so appointmentresource_set stays as written.
+        path.append(segment)
+        current = field.related_model
+    if not path:
+        return None, None, model
+    return kind, LOOKUP_SEP.join(path), current
+
+
+def _collect_eager_loading(serializer, model, prefix='', prefix_kind='select'):
+    select, prefetch = set(), set()
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if isinstance(field, serializers.SerializerMethodField):
+            continue
+        source = field.source or name
+        if source == '*':
+            continue
+        kind, path, tail_model = _resolve_source(model, source)
+        if path is None:
+            continue
+        # PrimaryKeyRelatedField reads <fk>_id off the row itself; a
+        # single-hop source needs no join for it.
+        if (isinstance(field, serializers.PrimaryKeyRelatedField)
+                and LOOKUP_SEP not in path):
+            continue
+        if prefix:
+            path = prefix + LOOKUP_SEP + path
+        if prefix_kind == 'prefetch' or kind == 'prefetch':
+            kind = 'prefetch'
+        (select if kind == 'select' else prefetch).add(path)
+
+        child = getattr(field, 'child', field)
+        if isinstance(child, serializers.BaseSerializer) and hasattr(child, 'fields'):
+            nested_select, nested_prefetch = _collect_eager_loading(
+                child, tail_model, prefix=path, prefix_kind=kind)
+            select |= nested_select
+            prefetch |= nested_prefetch
+    return select, prefetch
+
+
+def compute_only_fields(serializer_cls):
+    """Concrete columns a serializer reads, for queryset.only().
+
+    Relation sources contribute their first hop (the FK column; the
+    joined row itself is governed by select_related). Sources that are
+    model methods or properties contribute nothing here — serializers
+    using them declare the columns those methods touch in _ONLY_EXTRA.
+    """
+    model = serializer_cls.Meta.model
+    columns = {'pk'}
+    for name, field in serializer_cls().fields.items():
+        if field.write_only or isinstance(field, serializers.SerializerMethodField):
+            continue
+        source = field.source or name
+        if source == '*':
+            continue
+        model_field = _get_model_field(model, source.split('.')[0])
+        if model_field is None:
+            continue
+        if model_field.many_to_many or model_field.one_to_many:
+            continue
+        columns.add(model_field.name)
+    columns.update(getattr(serializer_cls, '_ONLY_EXTRA', ()))
+    return columns
+
+
+def compute_eager_loading(serializer_cls):
+    """Derive select_related/prefetch_related paths from the fields a
+    serializer actually renders, nested serializers included. Cached
+    per class — the declared fields never change at runtime."""
+    cached = _EAGER_LOADING_CACHE.get(serializer_cls)
+    if cached is None:
+        select, prefetch = _collect_eager_loading(
+            serializer_cls(), serializer_cls.Meta.model)
+        # A path that feeds a prefetch doesn't also need a join, and a
+        # prefix of a longer prefetch path is fetched along with it.
+        prefetch = {
+            p for p in prefetch
+            if not any(q.startswith(p + LOOKUP_SEP) for q in prefetch)
+        }
+        cached = (tuple(sorted(select - prefetch)), tuple(sorted(prefetch)))
+        _EAGER_LOADING_CACHE[serializer_cls] = cached
+    return cached
+
+
+_FULL_NAME_PARTS = ('first_name', 'middle_name', 'last_name', 'suffix')
+
+
+def full_name_annotation(relation):
+    """SQL twin of get_full_name(): non-empty name parts joined by
+    single spaces. Each part contributes ' part' or nothing, so blank
+    middle names and suffixes don't leave double spaces; LTrim drops
+    the leading one."""
+    pieces = []
+    for part in _FULL_NAME_PARTS:
+        col = f'{relation}__{part}'
+        pieces.append(Case(
+            When(Q(**{f'{col}__isnull': True}) | Q(**{col: ''}), then=Value('')),
+            default=Concat(Value(' '), F(col)),
+            output_field=CharField(),
+        ))
+    return LTrim(Concat(*pieces, output_field=CharField()))
+
+
+class FullNameField(serializers.CharField):
+    """Reads a DB-annotated full name off the row.
+
+    Instances that didn't come through the annotated queryset — the
+    echo of a create/update response, mostly — fall back to the related
+    object's get_full_name().
+    """
+
+    def __init__(self, relation, **kwargs):
+        self._relation = relation
+        kwargs.setdefault('read_only', True)
+        super().__init__(**kwargs)
+
+    def get_attribute(self, instance):
+        value = getattr(instance, self.source, None)
+        if value is not None:
+            return value
+        related = getattr(instance, self._relation, None)
+        return related.get_full_name() if related is not None else None
+
+
+_REPRESENTATION_PLAN_CACHE = {}
+
+# Field types (exact, not subclasses, which may override behaviour)
+# whose to_representation is a pure value conversion — no parent or
+# context access — so the bound method can be cached per class.
+_SIMPLE_FIELD_TYPES = (
+    serializers.BooleanField, serializers.CharField, serializers.ChoiceField,
+    serializers.DateField, serializers.DateTimeField, serializers.DecimalField,
+    serializers.FloatField, serializers.IntegerField, serializers.TimeField,
+    serializers.UUIDField,
+)
+
+
+def _make_attribute_getter(source_attrs):
+    """Build a plain-Python replacement for Field.get_attribute.
+
+    Walks the dotted source, short-circuits on None and calls method
+    sources like get_full_name, without DRF's per-field dispatch.
+    """
+    def getter(instance):
+        value = instance
+        for attr in source_attrs:
+            if value is None:
+                return None
+            value = getattr(value, attr)
+        return value() if callable(value) else value
+    return getter
+
+
+def _build_representation_plan(serializer):
+    """One (name, getter, convert) entry per readable field.
+
+    getter/convert are None for fields that need their bound instance
+    (nested serializers, relations, method fields); those go through
+    the regular DRF path at runtime.
+    """
+    plan = []
+    for name, field in serializer.fields.items():
+        if field.write_only:
+            continue
+        if type(field) in _SIMPLE_FIELD_TYPES:
+            plan.append((name, _make_attribute_getter(field.source_attrs),
+                         field.to_representation))
+        else:
+            plan.append((name, None, None))
+    return tuple(plan)
+
+
+class FastRepresentationMixin:
+    """Render rows from a per-class field plan instead of DRF dispatch.
+
+    DRF resolves every field's attribute through get_attribute and a
+    try/except per field per row. For the plain value fields — the bulk
+    of the appointment serializers — the plan caches a direct getter
+    and the field's conversion once per class; only nested serializers,
+    relations and method fields keep the stock path.
+    """
+
+    def to_representation(self, instance):
+        plan = _REPRESENTATION_PLAN_CACHE.get(type(self))
+        if plan is None:
+            plan = _build_representation_plan(self)
+            _REPRESENTATION_PLAN_CACHE[type(self)] = plan
+        data = {}
+        bound_fields = None
+        for name, getter, convert in plan:
+            if getter is not None:
+                value = getter(instance)
+                data[name] = None if value is None else convert(value)
+                continue
+            if bound_fields is None:
+                bound_fields = self.fields
+            field = bound_fields[name]
+            try:
+                attribute = field.get_attribute(instance)
+            except serializers.SkipField:
+                continue
+            check = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+            if check is None:
+                data[name] = None
+            else:
+                data[name] = field.to_representation(attribute)
+        return data
+
+
+class EagerLoadingMixin:
+    """Related-object loading derived from the serializer's own fields.
+
+    Viewsets call setup_eager_loading on their base queryset so the
+    joins always match the serializer actually in use (the basic list
+    serializer needs far less than the detail one). The paths are
+    introspected from the declared fields, so adding or removing a
+    field keeps the queries in step automatically.
+    """
+
+    # Columns read by model methods/properties the fields call into,
+    # which introspection cannot see (e.g. get_duration_display).
+    _ONLY_EXTRA = ()
+    # Queryset annotations the serializer's fields read, keyed by the
+    # attribute name the field sources (e.g. DB-computed full names).
+    _ANNOTATIONS = {}
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        select, prefetch = compute_eager_loading(cls)
+        if select:
+            queryset = queryset.select_related(*select)
+        if prefetch:
+            queryset = queryset.prefetch_related(*prefetch)
+        if cls._ANNOTATIONS:
+            queryset = queryset.annotate(**cls._ANNOTATIONS)
+        return queryset
+
+    @classmethod
+    def get_list_queryset(cls, queryset):
+        """Eager loading plus a narrowed SELECT for list rendering.
+
+        List rows are read-only, so deferring the columns the
+        serializer never touches (the long clinical text fields in
+        particular) is safe and keeps large pages off the TOAST path.
+        """
+        return cls.setup_eager_loading(queryset).only(
+            *compute_only_fields(cls))
+
 
 class ResourceSerializer(serializers.ModelSerializer):
     class Meta:
@@ -60,9 +348,14 @@ class AppointmentHistorySerializer(serializers.ModelSerializer):
         ]
 
 
-class AppointmentSerializer(serializers.ModelSerializer):
-    patient_name = serializers.CharField(source='patient.get_full_name', read_only=True)
-    provider_name = serializers.CharField(source='primary_provider.get_full_name', read_only=True)
+class AppointmentSerializer(FastRepresentationMixin, EagerLoadingMixin, serializers.ModelSerializer):
+    _ANNOTATIONS = {
+        'patient_full_name': full_name_annotation('patient'),
+        'provider_full_name': full_name_annotation('primary_provider'),
+    }
+
+    patient_name = FullNameField('patient', source='patient_full_name')
+    provider_name = FullNameField('primary_provider', source='provider_full_name')
     duration_display = serializers.CharField(source='get_duration_display', read_only=True)
     resources = AppointmentResourceSerializer(source='appointmentresource_set', many=True, read_only=True)
     reminders = AppointmentReminderSerializer(many=True, read_only=True)
@@ -106,29 +399,86 @@ class AppointmentSerializer(serializers.ModelSerializer):
         return attrs
 
     def create(self, validated_data):
+        additional_providers = validated_data.pop('additional_providers', None)
         instance = Appointment(**validated_data)
         try:
-            instance.full_clean()
+            # DRF's field validation already ran, so full_clean would
+            # re-check types/choices/lengths for nothing, and
+            # validate_unique would SELECT against the uuid index per
+            # request when the DB constraint enforces it anyway. Only
+            # the model's cross-field clean() remains worth running.
+            instance.clean()
         except DjangoValidationError as e:
-            raise serializers.ValidationError(e.message_dict or e.messages)
-        instance.save()
+            # clean() errors aren't keyed by field the way full_clean's
+            # are, so message_dict may not exist.
+            raise serializers.ValidationError(
+                getattr(e, 'message_dict', None) or e.messages)
+        try:
+            instance.save()
+        except IntegrityError as e:
+            # Overlaps surface as the appt_no_overlap exclusion
+            # constraint rather than a pre-save SELECT.
+            if 'appt_no_overlap' in str(e):
+                raise serializers.ValidationError('Overlapping appointment for this provider')
+            raise
+        if additional_providers:
+            instance.additional_providers.set(additional_providers)
+        # A recurring request expands through the bulk_create path
+        # instead of N one-at-a-time saves.
+        if (instance.is_recurring and instance.recurrence_pattern
+                and instance.recurrence_end_date):
+            Appointment.create_series(
+                instance, instance.recurrence_pattern,
+                instance.recurrence_end_date)
         return instance
 
     def update(self, instance, validated_data):
+        m2m_values = {}
+        changed = []
         for field, value in validated_data.items():
-            setattr(instance, field, value)
-        try:
-            instance.full_clean()
-        except DjangoValidationError as e:
-            raise serializers.ValidationError(e.message_dict or e.messages)
-        instance.save()
+            model_field = _get_model_field(Appointment, field)
+            if model_field is not None and model_field.many_to_many:
+                m2m_values[field] = value
+                continue
+            if getattr(instance, field) != value:
+                setattr(instance, field, value)
+                changed.append(field)
+        if changed:
+            # Only write what actually changed, plus the columns the
+            # model's save() derives from those fields.
+            update_fields = set(changed) | {'updated_at'}
+            if {'start_at', 'end_at'} & update_fields:
+                update_fields.add('duration_minutes')
+            if 'is_recurring' in update_fields:
+                update_fields.add('series_id')
+            if 'template' in update_fields:
+                update_fields.add('effective_cancellation_hours')
+            try:
+                instance.clean()
+            except DjangoValidationError as e:
+                raise serializers.ValidationError(
+                    getattr(e, 'message_dict', None) or e.messages)
+            try:
+                instance.save(update_fields=sorted(update_fields))
+            except IntegrityError as e:
+                if 'appt_no_overlap' in str(e):
+                    raise serializers.ValidationError('Overlapping appointment for this provider')
+                raise
+        for field, value in m2m_values.items():
+            getattr(instance, field).set(value)
         return instance
 
 
-class AppointmentBasicSerializer(serializers.ModelSerializer):
+class AppointmentBasicSerializer(FastRepresentationMixin, EagerLoadingMixin, serializers.ModelSerializer):
     """A simplified serializer for appointments in lists or references"""
-    patient_name = serializers.CharField(source='patient.get_full_name', read_only=True)
-    provider_name = serializers.CharField(source='primary_provider.get_full_name', read_only=True)
+    _ONLY_EXTRA = ('duration_minutes',)  # get_duration_display
+    _ANNOTATIONS = {
+        'patient_full_name': full_name_annotation('patient'),
+        'provider_full_name': full_name_annotation('primary_provider'),
+    }
+
+    patient_name = FullNameField('patient', source='patient_full_name')
+    provider_name = FullNameField('primary_provider', source='provider_full_name')
     duration_display = serializers.CharField(source='get_duration_display', read_only=True)
     
     # Backward compatibility
@@ -144,10 +494,16 @@ class AppointmentBasicSerializer(serializers.ModelSerializer):
         ]
 
 
-class WaitListSerializer(serializers.ModelSerializer):
-    patient_name = serializers.CharField(source='patient.get_full_name', read_only=True)
-    provider_name = serializers.CharField(source='provider.get_full_name', read_only=True)
-    created_by_name = serializers.CharField(source='created_by.get_full_name', read_only=True)
+class WaitListSerializer(EagerLoadingMixin, serializers.ModelSerializer):
+    _ANNOTATIONS = {
+        'patient_full_name': full_name_annotation('patient'),
+        'provider_full_name': full_name_annotation('provider'),
+        'created_by_full_name': full_name_annotation('created_by'),
+    }
+
+    patient_name = FullNameField('patient', source='patient_full_name')
+    provider_name = FullNameField('provider', source='provider_full_name')
+    created_by_name = FullNameField('created_by', source='created_by_full_name')
     
     class Meta:
         model = WaitList
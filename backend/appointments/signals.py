@@ -0,0 +1,56 @@
+"""
+Signal handlers for the appointments app.
+"""
+
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .cache import invalidate_refdata
+from .models import (
+    Appointment, AppointmentHistory, AppointmentReminder,
+    AppointmentTemplate, Resource,
+)
+
+
+@receiver(pre_save, sender=AppointmentReminder,
+          dispatch_uid='appointments.stamp_reminder_label')
+@receiver(pre_save, sender=AppointmentHistory,
+          dispatch_uid='appointments.stamp_history_label')
+def stamp_appointment_label(sender, instance, **kwargs):
+    """Fill the denormalized label when a dependent row is created."""
+    if not instance.appointment_label and instance.appointment_id:
+        instance.appointment_label = str(instance.appointment)[:255]
+
+
+@receiver(post_save, sender=Appointment,
+          dispatch_uid='appointments.refresh_appointment_labels')
+def refresh_appointment_labels(sender, instance, created, **kwargs):
+    """Propagate label changes to reminders and history rows.
+
+    The changelists read appointment_label from their own table instead
+    of joining patient and provider per row; a rename or reschedule
+    rewrites the dependents with two bulk UPDATEs.
+    """
+    if created:
+        return
+    label = str(instance)[:255]
+    AppointmentReminder.objects.filter(appointment_id=instance.pk).exclude(
+        appointment_label=label).update(appointment_label=label)
+    AppointmentHistory.objects.filter(appointment_id=instance.pk).exclude(
+        appointment_label=label).update(appointment_label=label)
+
+
+@receiver(post_save, sender=AppointmentTemplate,
+          dispatch_uid='appointments.refdata_template_save')
+@receiver(post_delete, sender=AppointmentTemplate,
+          dispatch_uid='appointments.refdata_template_delete')
+@receiver(post_save, sender=Resource,
+          dispatch_uid='appointments.refdata_resource_save')
+@receiver(post_delete, sender=Resource,
+          dispatch_uid='appointments.refdata_resource_delete')
+def drop_refdata_cache(sender, instance, **kwargs):
+    """Version-bump the reference-data cache when it changes."""
+    try:
+        invalidate_refdata(sender)
+    except Exception as exc:
+        print(f'refdata cache invalidation failed: {exc}')
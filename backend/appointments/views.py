@@ -1,19 +1,23 @@
 from django.shortcuts import render
+from django.core.exceptions import ValidationError as DjangoValidationError
 from rest_framework import viewsets, status, filters, permissions
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import PermissionDenied
 from django.shortcuts import get_object_or_404
-from django.db.models import Q, Count
+from django.core.cache import cache
+from django.db.models import F, Q, Count
 from django.utils import timezone
 from django.conf import settings
 from datetime import datetime, timedelta, time
 from django_filters.rest_framework import DjangoFilterBackend
 from core.permissions import RolePermission, ModuleEnabledPermission
+from .cache import REFDATA_TTL_SECONDS, refdata_list_key
 from .models import (
     Appointment, AppointmentTemplate, Resource, WaitList, 
-    AppointmentReminder, AppointmentHistory, AppointmentStatus
+    AppointmentReminder, AppointmentHistory, AppointmentStatus,
+    ACTIVE_APPOINTMENT_STATUSES
 )
 from .serializers import (
     AppointmentSerializer, AppointmentBasicSerializer, AppointmentTemplateSerializer,
@@ -22,7 +26,31 @@ from .serializers import (
 )
 
 
-class AppointmentTemplateViewSet(viewsets.ModelViewSet):
+class CachedRefdataListMixin:
+    """Serve list pages of read-mostly reference data from cache.
+
+    Templates and resources are fetched on every booking flow but
+    change rarely; cached pages live five minutes and any write bumps
+    the model's cache version (see appointments.cache).
+    """
+
+    def list(self, request, *args, **kwargs):
+        user = request.user
+        if user.is_superuser or getattr(user, 'role', None) == 'SUPER_ADMIN':
+            scope = 'all'
+        else:
+            scope = getattr(user, 'hospital_id', None)
+        model = self.get_serializer_class().Meta.model
+        key = refdata_list_key(model, scope, request.query_params.urlencode())
+        data = cache.get(key)
+        if data is not None:
+            return Response(data)
+        response = super().list(request, *args, **kwargs)
+        cache.set(key, response.data, REFDATA_TTL_SECONDS)
+        return response
+
+
+class AppointmentTemplateViewSet(CachedRefdataListMixin, viewsets.ModelViewSet):
     serializer_class = AppointmentTemplateSerializer
     permission_classes = [IsAuthenticated, ModuleEnabledPermission]
     required_module = 'enable_opd'
@@ -41,7 +69,7 @@ class AppointmentTemplateViewSet(viewsets.ModelViewSet):
         return qs.filter(hospital_id=user.hospital_id)
 
 
-class ResourceViewSet(viewsets.ModelViewSet):
+class ResourceViewSet(CachedRefdataListMixin, viewsets.ModelViewSet):
     serializer_class = ResourceSerializer
     permission_classes = [IsAuthenticated, ModuleEnabledPermission]
     required_module = 'enable_opd'
@@ -108,7 +136,14 @@ class AppointmentViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         user = self.request.user
-        qs = Appointment.objects.select_related('patient', 'primary_provider', 'hospital', 'template').all()
+        # Eager loading follows the serializer in play: the basic list
+        # serializer only joins patient and provider, and list rows are
+        # narrowed to the columns it actually renders.
+        serializer_class = self.get_serializer_class()
+        if self.action == 'list':
+            qs = serializer_class.get_list_queryset(Appointment.objects.all())
+        else:
+            qs = serializer_class.setup_eager_loading(Appointment.objects.all())
         
         if user.is_superuser or getattr(user, 'role', None) == 'SUPER_ADMIN':
             queryset = qs
@@ -216,7 +251,9 @@ class AppointmentViewSet(viewsets.ModelViewSet):
         appointment.status = AppointmentStatus.CONFIRMED
         appointment.confirmed_at = timezone.now()
         appointment.confirmed_by = request.user
-        appointment.save()
+        # State transitions name their columns so the wide appointment
+        # row (encrypted text included) isn't rewritten wholesale.
+        appointment.save(update_fields=['status', 'confirmed_at', 'confirmed_by', 'updated_at'])
         
         # Create history entry
         AppointmentHistory.objects.create(
@@ -233,12 +270,13 @@ class AppointmentViewSet(viewsets.ModelViewSet):
     def check_in(self, request, pk=None):
         """Check in patient for appointment"""
         appointment = self.get_object()
-        if appointment.status not in [AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED]:
-            return Response({'error': 'Cannot check in this appointment'}, 
+        try:
+            appointment.check_in(request.user)
+        except DjangoValidationError:
+            # Wrong starting state, or a concurrent check-in won.
+            return Response({'error': 'Cannot check in this appointment'},
                           status=status.HTTP_400_BAD_REQUEST)
         
-        appointment.check_in(request.user)
-        
         # Create history entry
         AppointmentHistory.objects.create(
             appointment=appointment,
@@ -259,7 +297,7 @@ class AppointmentViewSet(viewsets.ModelViewSet):
                           status=status.HTTP_400_BAD_REQUEST)
         
         appointment.status = AppointmentStatus.IN_PROGRESS
-        appointment.save()
+        appointment.save(update_fields=['status', 'updated_at'])
         
         # Create history entry
         AppointmentHistory.objects.create(
@@ -283,7 +321,7 @@ class AppointmentViewSet(viewsets.ModelViewSet):
                           status=status.HTTP_400_BAD_REQUEST)
         
         appointment.status = AppointmentStatus.COMPLETED
-        appointment.save()
+        appointment.save(update_fields=['status', 'updated_at'])
         
         # Generate bill if not exists
         try:
@@ -337,7 +375,10 @@ class AppointmentViewSet(viewsets.ModelViewSet):
         appointment.cancelled_at = timezone.now()
         appointment.cancellation_reason = request.data.get('reason', '')
         appointment.cancellation_notes = request.data.get('notes', '')
-        appointment.save()
+        appointment.save(update_fields=[
+            'status', 'cancelled_by', 'cancelled_at',
+            'cancellation_reason', 'cancellation_notes', 'updated_at',
+        ])
         
         # Create history entry
         AppointmentHistory.objects.create(
@@ -367,7 +408,10 @@ class AppointmentViewSet(viewsets.ModelViewSet):
         appointment.start_at = new_start_time
         appointment.end_at = new_end_time
         appointment.status = AppointmentStatus.RESCHEDULED
-        appointment.save()
+        # duration_minutes is recomputed by save() from the new times.
+        appointment.save(update_fields=[
+            'start_at', 'end_at', 'duration_minutes', 'status', 'updated_at',
+        ])
         
         # Create history entry
         AppointmentHistory.objects.create(
@@ -387,7 +431,11 @@ class AppointmentViewSet(viewsets.ModelViewSet):
     def mark_no_show(self, request, pk=None):
         """Mark appointment as no-show"""
         appointment = self.get_object()
-        appointment.mark_as_no_show(request.user)
+        try:
+            appointment.mark_as_no_show(request.user)
+        except DjangoValidationError:
+            return Response({'error': 'Appointment is already in a terminal state'},
+                          status=status.HTTP_400_BAD_REQUEST)
         
         # Create history entry
         AppointmentHistory.objects.create(
@@ -438,7 +486,7 @@ class AppointmentViewSet(viewsets.ModelViewSet):
         existing = Appointment.objects.filter(
             primary_provider_id=doctor_id, 
             start_at__date=target_date, 
-            status__in=[AppointmentStatus.SCHEDULED, AppointmentStatus.CONFIRMED, AppointmentStatus.IN_PROGRESS]
+            status__in=ACTIVE_APPOINTMENT_STATUSES
         ).values_list('start_at', 'end_at')
         
         while current + timedelta(minutes=slot_minutes) <= end_dt:
@@ -466,7 +514,7 @@ class WaitListViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         user = self.request.user
-        qs = WaitList.objects.all()
+        qs = WaitListSerializer.setup_eager_loading(WaitList.objects.all())
         if user.is_superuser or getattr(user, 'role', None) == 'SUPER_ADMIN':
             return qs
         if getattr(user, 'hospital_id', None) is None:
@@ -479,9 +527,13 @@ class WaitListViewSet(viewsets.ModelViewSet):
         waitlist_entry = self.get_object()
         
         # Implementation would send notification to patient
-        waitlist_entry.notified_count += 1
-        waitlist_entry.last_notification = timezone.now()
-        waitlist_entry.save()
+        # F() increments server-side so concurrent notifications can't
+        # lose counts to a read-modify-write race.
+        WaitList.objects.filter(pk=waitlist_entry.pk).update(
+            notified_count=F('notified_count') + 1,
+            last_notification=timezone.now(),
+        )
+        waitlist_entry.refresh_from_db(fields=['notified_count', 'last_notification'])
         
         return Response({
             'message': 'Patient notified successfully',
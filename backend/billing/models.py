@@ -14,9 +14,11 @@ class Bill(TenantModel):
 	net_cents = models.IntegerField(default=0)
 
 	def recalc(self):
-		total = sum(item.amount_cents for item in self.items.all())
+		# Aggregate in the DB; hydrating every line item and payment
+		# just to sum one column allocates a model instance per row.
+		total = self.items.aggregate(total=models.Sum('amount_cents'))['total'] or 0
 		self.total_cents = total
-		paid = sum(p.amount_cents for p in self.payments.all())
+		paid = self.payments.aggregate(total=models.Sum('amount_cents'))['total'] or 0
 		self.paid_cents = paid
 		self.net_cents = max(total - self.discount_cents, 0)
 		self.status = 'PAID' if paid >= self.net_cents and self.net_cents > 0 else ('PARTIAL' if 0 < paid < self.net_cents else 'DUE')
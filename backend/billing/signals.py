@@ -0,0 +1,27 @@
+"""
+Signal handlers for the billing app.
+"""
+
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+from .models import Bill, BillLineItem, Payment
+
+
+@receiver(post_delete, sender=BillLineItem,
+          dispatch_uid='billing.recalc_on_item_delete')
+@receiver(post_delete, sender=Payment,
+          dispatch_uid='billing.recalc_on_payment_delete')
+def recalc_bill_on_delete(sender, instance, **kwargs):
+    """Keep bill totals current when items or payments are removed.
+
+    The save() overrides recalc on create/update, but deletes — queryset
+    deletes included — bypassed them and left stale totals. post_delete
+    fires per row on both paths.
+    """
+    try:
+        bill = Bill.objects.get(pk=instance.bill_id)
+    except Bill.DoesNotExist:
+        # Cascade from the bill itself being deleted.
+        return
+    bill.recalc()
@@ -0,0 +1,55 @@
+"""
+Changelist filter classes shared across admins.
+"""
+
+from django.contrib import admin
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+
+CHOICES_CACHE_TIMEOUT = 3600
+
+
+def _choices_cache_key(model, field_path):
+    return f'admin-filter-choices:{model._meta.label_lower}:{field_path}'
+
+
+def _connect_invalidation(model, key):
+    """Clear a cached choice list whenever the model's rows change"""
+
+    def clear_choices(**kwargs):
+        cache.delete(key)
+
+    # dispatch_uid makes repeated connects no-ops; weak=False keeps the
+    # closure alive.
+    post_save.connect(clear_choices, sender=model, weak=False,
+                      dispatch_uid=f'{key}:save')
+    post_delete.connect(clear_choices, sender=model, weak=False,
+                        dispatch_uid=f'{key}:delete')
+
+
+class CachedChoicesMixin:
+    """Memoize a related filter's dropdown choices in the cache.
+
+    Building the choice list queries the related table on every
+    changelist render; for stable tables like hospitals and providers
+    that's pure repeat work. Choices are cached for an hour and evicted
+    when either side of the relation changes.
+    """
+
+    def field_choices(self, field, request, model_admin):
+        key = _choices_cache_key(model_admin.model, self.field_path)
+        choices = cache.get(key)
+        if choices is None:
+            choices = super().field_choices(field, request, model_admin)
+            cache.set(key, choices, CHOICES_CACHE_TIMEOUT)
+            _connect_invalidation(field.remote_field.model, key)
+            _connect_invalidation(model_admin.model, key)
+        return choices
+
+
+class CachedRelatedFieldListFilter(CachedChoicesMixin, admin.RelatedFieldListFilter):
+    pass
+
+
+class CachedRelatedOnlyFieldListFilter(CachedChoicesMixin, admin.RelatedOnlyFieldListFilter):
+    pass
@@ -0,0 +1,82 @@
+"""
+Database field types shared across apps.
+"""
+
+import base64
+import os
+from functools import lru_cache
+
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from django.conf import settings
+from django.db import models
+from django.utils.encoding import force_str
+
+_NONCE_SIZE = 12
+_PREFIX = 'gcm$'
+
+
+def _key_bytes():
+    key = settings.FIELD_ENCRYPTION_KEY
+    if isinstance(key, str):
+        key = key.encode('utf-8')
+    return key
+
+
+@lru_cache(maxsize=1)
+def _aesgcm():
+    return AESGCM(base64.urlsafe_b64decode(_key_bytes()))
+
+
+@lru_cache(maxsize=1)
+def _legacy_fernet():
+    return Fernet(_key_bytes())
+
+
+class AesGcmTextField(models.TextField):
+    """TextField encrypted at rest with AES-256-GCM.
+
+    Drop-in replacement for EncryptedTextField: Fernet runs AES-CBC plus
+    a separate HMAC pass per read/write, while AES-GCM goes through
+    OpenSSL's EVP layer and uses AES-NI. Values are stored as
+    'gcm$' + base64(nonce || ciphertext || tag); legacy Fernet tokens
+    (and plaintext from the first deploy) still decrypt until the
+    re-encryption migration has run.
+    """
+
+    def _encrypt(self, value):
+        nonce = os.urandom(_NONCE_SIZE)
+        sealed = _aesgcm().encrypt(nonce, value.encode('utf-8'), None)
+        return _PREFIX + base64.b64encode(nonce + sealed).decode('ascii')
+
+    def _decrypt(self, value):
+        if value.startswith(_PREFIX):
+            blob = base64.b64decode(value[len(_PREFIX):])
+            try:
+                return _aesgcm().decrypt(
+                    blob[:_NONCE_SIZE], blob[_NONCE_SIZE:], None
+                ).decode('utf-8')
+            except InvalidTag:
+                return value
+        try:
+            return _legacy_fernet().decrypt(value.encode('utf-8')).decode('utf-8')
+        except (InvalidToken, ValueError, TypeError):
+            # Pre-encryption legacy rows; return as-is.
+            return value
+
+    def get_prep_value(self, value):
+        value = super().get_prep_value(value)
+        if value in ('', None):
+            return value
+        return self._encrypt(force_str(value))
+
+    def from_db_value(self, value, expression, connection):
+        if value in ('', None):
+            return value
+        return self._decrypt(value)
+
+    def to_python(self, value):
+        if value in ('', None):
+            return value
+        return self._decrypt(value)
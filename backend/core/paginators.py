@@ -0,0 +1,32 @@
+"""
+Paginator variants shared across admins.
+"""
+
+from django.core.paginator import Paginator
+from django.db import connection
+from django.utils.functional import cached_property
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginate with the planner's row estimate instead of COUNT(*).
+
+    On large tables the unbounded COUNT(*) behind the page links is often
+    slower than the page query itself. For an unfiltered changelist the
+    pg_class.reltuples estimate is accurate enough for page numbering;
+    filtered querysets and non-PostgreSQL databases fall back to the
+    real count.
+    """
+
+    @cached_property
+    def count(self):
+        if connection.vendor == 'postgresql' and not self.object_list.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'SELECT reltuples::bigint FROM pg_class WHERE relname = %s',
+                    [self.object_list.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 before the first ANALYZE.
+            if row is not None and row[0] >= 0:
+                return row[0]
+        return super().count
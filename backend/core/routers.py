@@ -0,0 +1,32 @@
+"""
+Database routing for read-heavy reporting workloads.
+
+When a read replica is configured (POSTGRES_REPLICA_HOST), a 'replica'
+alias is added to DATABASES and reporting code sends its scans there via
+reporting_db(), keeping long aggregations off the primary. Without a
+replica everything falls back to 'default', so the code path is the same
+in every environment.
+"""
+
+from django.conf import settings
+
+REPLICA_ALIAS = 'replica'
+
+
+def reporting_db():
+    """Alias reporting queries should read from"""
+    if REPLICA_ALIAS in settings.DATABASES:
+        return REPLICA_ALIAS
+    return 'default'
+
+
+class ReportingRouter:
+    """Keep the replica alias read-only and out of migrations"""
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db == REPLICA_ALIAS:
+            return False
+        return None
@@ -118,6 +118,13 @@ if os.getenv('POSTGRES_DB'):
             'PORT': os.getenv('POSTGRES_PORT', '5432'),
         }
     }
+    # Optional read replica for reporting scans (see core.routers).
+    if os.getenv('POSTGRES_REPLICA_HOST'):
+        DATABASES['replica'] = {
+            **DATABASES['default'],
+            'HOST': os.getenv('POSTGRES_REPLICA_HOST'),
+            'PORT': os.getenv('POSTGRES_REPLICA_PORT', os.getenv('POSTGRES_PORT', '5432')),
+        }
 else:
     DATABASES = {
         'default': {
@@ -126,6 +133,8 @@ else:
         }
     }
 
+DATABASE_ROUTERS = ['core.routers.ReportingRouter']
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -2,6 +2,7 @@ from rest_framework import serializers
 from django.contrib.auth import get_user_model, authenticate
 from django.contrib.auth.password_validation import validate_password
 from django.core.exceptions import ValidationError
+from django.db.models import Count, Q
 from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
 from hospitals.models import HospitalPlan
 from .models import User, Department, UserPermissionGroup, UserSession, UserLoginHistory, UserCredential
@@ -23,14 +24,36 @@ class DepartmentSerializer(serializers.ModelSerializer):
             'created_at', 'updated_at'
         ]
     
+    @classmethod
+    def annotate_counts(cls, queryset):
+        """Compute both counts in the list query itself.
+
+        Without this the two count fields run a COUNT query per
+        department per row; annotated querysets satisfy them from the
+        row attributes below.
+        """
+        return queryset.annotate(
+            active_user_count=Count(
+                'users', filter=Q(users__status='ACTIVE'), distinct=True),
+            active_subdepartment_count=Count(
+                'subdepartments', filter=Q(subdepartments__is_active=True),
+                distinct=True),
+        )
+
     def get_head_name(self, obj):
         return obj.head.get_full_name() if obj.head else None
-    
+
     def get_user_count(self, obj):
-        return obj.users.filter(status='ACTIVE').count()
-    
+        count = getattr(obj, 'active_user_count', None)
+        if count is None:
+            count = obj.users.filter(status='ACTIVE').count()
+        return count
+
     def get_subdepartments_count(self, obj):
-        return obj.subdepartments.filter(is_active=True).count()
+        count = getattr(obj, 'active_subdepartment_count', None)
+        if count is None:
+            count = obj.subdepartments.filter(is_active=True).count()
+        return count
 
 
 class UserCredentialSerializer(serializers.ModelSerializer):